@@ -3,20 +3,34 @@
 Launcher script for Gmail Export Tool.
 """
 import argparse
-from src.main import main as cli_main
-from src.gui import main as gui_main
+import multiprocessing
 
 
 def main():
     parser = argparse.ArgumentParser(description="Gmail Export Tool")
     parser.add_argument("--gui", action="store_true", help="Run in GUI mode")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Profile the run with cProfile and write .prof files to data/profiles"
+    )
     args = parser.parse_args()
 
-    if args.gui:
-        gui_main()
-    else:
-        cli_main()
+    from src import profiling
+    if args.profile:
+        profiling.enable()
+
+    # Import the selected front end lazily so CLI runs never load PyQt6
+    # and --help returns without importing the Google API stack.
+    with profiling.profiled("main", report=True):
+        if args.gui:
+            from src.gui import main as gui_main
+            gui_main()
+        else:
+            from src.main import main as cli_main
+            cli_main()
 
 
 if __name__ == "__main__":
+    # Exports run in worker processes; needed for PyInstaller builds
+    multiprocessing.freeze_support()
     main()
@@ -8,10 +8,14 @@ import re
 from typing import List, Dict, Optional
 from src import config
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+
+# Email validation is split at the last '@' so each half is checked by a
+# single fully matched character class, which cannot backtrack.
+_LOCAL_RE = re.compile(r'[A-Za-z0-9._%+-]+')
+_DOMAIN_RE = re.compile(r'[A-Za-z0-9.-]+')
+
+# Marks an email absent from the token path memo; None is a valid answer
+_MISSING = object()
 
 class GmailAccountManager:
     """Manages Gmail account operations."""
@@ -20,6 +24,10 @@ class GmailAccountManager:
         """Initialize the account manager."""
         self.logger = logging.getLogger(__name__)
         self.file_manager = file_manager
+        self._accounts_data = None
+        self._accounts_mtime = None
+        self._by_email = {}
+        self._token_path_cache: Dict[str, Optional[str]] = {}
         self._ensure_accounts_file()
 
     def _ensure_accounts_file(self):
@@ -29,21 +37,51 @@ class GmailAccountManager:
                 json.dump({"accounts": []}, f)
 
     def _load_accounts(self) -> Dict:
-        """Load accounts from file."""
+        """
+        Load accounts from file.
+
+        The parsed data is cached in memory and only re-read when the file's
+        modification time changes (e.g. edited by another process).
+        """
         try:
+            mtime = os.path.getmtime(config.ACCOUNTS_FILE)
+            if self._accounts_data is not None and mtime == self._accounts_mtime:
+                return self._accounts_data
+
             with open(config.ACCOUNTS_FILE, "r") as f:
-                return json.load(f)
+                accounts_data = json.load(f)
+            self._cache_accounts(accounts_data, mtime)
+            return accounts_data
         except Exception as e:
             self.logger.error(f"Error loading accounts: {str(e)}")
+            self._cache_accounts(None, None)
             return {"accounts": []}
 
     def _save_accounts(self, accounts_data: Dict):
-        """Save accounts to file."""
+        """Save accounts to file and refresh the in-memory cache."""
+        tmp_file = config.ACCOUNTS_FILE + ".tmp"
         try:
-            with open(config.ACCOUNTS_FILE, "w") as f:
-                json.dump(accounts_data, f, indent=4)
+            # Write compactly to a temp file and swap it in atomically
+            with open(tmp_file, "w") as f:
+                json.dump(accounts_data, f, separators=(",", ":"))
+            os.replace(tmp_file, config.ACCOUNTS_FILE)
+            self._cache_accounts(accounts_data, os.path.getmtime(config.ACCOUNTS_FILE))
         except Exception as e:
             self.logger.error(f"Error saving accounts: {str(e)}")
+            # Drop the cache so the next load reflects what is on disk
+            self._cache_accounts(None, None)
+
+    def _cache_accounts(self, accounts_data: Optional[Dict], mtime: Optional[float]):
+        """Store accounts data in memory along with an email -> account index."""
+        self._accounts_data = accounts_data
+        self._accounts_mtime = mtime
+        self._token_path_cache.clear()
+        if accounts_data is None:
+            self._by_email = {}
+        else:
+            self._by_email = {
+                acc["email"]: acc for acc in accounts_data.get("accounts", [])
+            }
 
     def list_accounts(self) -> List[str]:
         """List all registered accounts."""
@@ -52,11 +90,8 @@ class GmailAccountManager:
 
     def get_account_details(self, email: str) -> Optional[Dict]:
         """Get account details including auth method and app password if IMAP."""
-        accounts_data = self._load_accounts()
-        for account in accounts_data.get("accounts", []):
-            if account["email"] == email:
-                return account
-        return None
+        self._load_accounts()
+        return self._by_email.get(email)
 
     def add_account(self, email: str, auth_method: str = "oauth", app_password: str = None) -> bool:
         """
@@ -74,7 +109,7 @@ class GmailAccountManager:
             accounts_data = self._load_accounts()
             
             # Check if account already exists
-            if any(acc["email"] == email for acc in accounts_data["accounts"]):
+            if email in self._by_email:
                 self.logger.warning(f"Account {email} already exists")
                 return False
             
@@ -105,7 +140,8 @@ class GmailAccountManager:
         try:
             accounts_data = self._load_accounts()
             
-            # Find and remove account
+            # Find and remove account; filter the stored list rather than
+            # rebuild it from the index, which holds one entry per email
             accounts_data["accounts"] = [
                 acc for acc in accounts_data["accounts"]
                 if acc["email"] != email
@@ -113,8 +149,9 @@ class GmailAccountManager:
             
             self._save_accounts(accounts_data)
             
-            # Clean up token file if exists
+            # Clean up token file and cached messages if they exist
             self.file_manager.cleanup_token(email)
+            self.file_manager.cleanup_message_cache(email)
             
             self.logger.info(f"Removed account {email}")
             return True
@@ -124,11 +161,25 @@ class GmailAccountManager:
             return False
 
     def get_account_token_path(self, email: str) -> Optional[str]:
-        """Get token path for OAuth accounts only."""
-        account = self.get_account_details(email)
+        """
+        Get token path for OAuth accounts only.
+
+        Answers are memoized until the accounts are next (re)loaded or saved,
+        which clears the memo through _cache_accounts.
+        """
+        # Reload first so an edit by another process clears a stale memo.
+        # A single get cannot race a clear() from another thread
+        self._load_accounts()
+        token_path = self._token_path_cache.get(email, _MISSING)
+        if token_path is not _MISSING:
+            return token_path
+
+        account = self._by_email.get(email)
+        token_path = None
         if account and account.get("auth_method") == "oauth":
-            return self.file_manager.get_token_path(email)
-        return None
+            token_path = self.file_manager.get_token_path(email)
+        self._token_path_cache[email] = token_path
+        return token_path
 
     @staticmethod
     def _validate_email(email: str) -> bool:
@@ -141,5 +192,18 @@ class GmailAccountManager:
         Returns:
             bool: True if valid, False otherwise.
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email)) 
\ No newline at end of file
+        local, sep, domain = email.rpartition('@')
+        if not sep or not local or not domain:
+            return False
+        if _LOCAL_RE.fullmatch(local) is None:
+            return False
+
+        label, dot, tld = domain.rpartition('.')
+        if not dot or not label:
+            return False
+        return (
+            len(tld) >= 2
+            and tld.isascii()
+            and tld.isalpha()
+            and _DOMAIN_RE.fullmatch(label) is not None
+        ) 
\ No newline at end of file
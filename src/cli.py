@@ -13,6 +13,30 @@ from src import config
 # Initialize colorama
 init()
 
+
+def _parse_ymd(value: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD string without going through strptime.
+
+    Accepts the same input as strptime(value, "%Y-%m-%d"): a four-digit
+    year and a one- or two-digit month and day, so "2024-1-5" is fine.
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date.
+    """
+    parts = value.split("-")
+    if (
+        len(parts) != 3
+        or not all(part.isascii() and part.isdigit() for part in parts)
+        or len(parts[0]) != 4
+        or not 1 <= len(parts[1]) <= 2
+        or not 1 <= len(parts[2]) <= 2
+    ):
+        raise ValueError(f"Invalid date: {value!r}")
+    year, month, day = parts
+    return datetime(int(year), int(month), int(day))
+
+
 class EnhancedCLI:
     """Enhanced CLI interface with colors and interactive features."""
 
@@ -23,29 +47,29 @@ class EnhancedCLI:
 
     def _ensure_config_files(self):
         """Ensure necessary config files exist."""
-        date_config_file = os.path.join(config.CONFIG_DIR, "date_config.json")
-        if not os.path.exists(date_config_file):
+        if not os.path.exists(config.DATE_CONFIG_FILE):
             default_config = {
                 "start_date": datetime.now().replace(day=1).strftime("%Y-%m-%d"),
                 "end_date": datetime.now().strftime("%Y-%m-%d")
             }
-            with open(date_config_file, "w") as f:
+            with open(config.DATE_CONFIG_FILE, "w") as f:
                 json.dump(default_config, f, indent=4)
 
     def display_banner(self):
         """Display the application banner."""
-        print(f"\n{Fore.CYAN}Gmail Export Tool{Style.RESET_ALL}")
-        print("=" * 50)
+        print(f"\n{Fore.CYAN}Gmail Export Tool{Style.RESET_ALL}\n{'=' * 50}")
 
     def display_menu(self):
         """Display the main menu."""
-        print(f"\n{Fore.YELLOW}Menu Options:{Style.RESET_ALL}")
-        print("1. Add Gmail Account")
-        print("2. Remove Gmail Account")
-        print("3. Export Emails (Single Account)")
-        print("4. Export Emails (All Accounts)")
-        print("5. Configure Date Range")
-        print("6. Exit")
+        print(
+            f"\n{Fore.YELLOW}Menu Options:{Style.RESET_ALL}\n"
+            "1. Add Gmail Account\n"
+            "2. Remove Gmail Account\n"
+            "3. Export Emails (Single Account)\n"
+            "4. Export Emails (All Accounts)\n"
+            "5. Configure Date Range\n"
+            "6. Exit"
+        )
 
     def get_menu_choice(self) -> int:
         """
@@ -108,13 +132,12 @@ class EnhancedCLI:
         Returns:
             Tuple[datetime, datetime]: Start and end dates.
         """
-        date_config_file = os.path.join(config.CONFIG_DIR, "date_config.json")
         try:
-            with open(date_config_file, "r") as f:
+            with open(config.DATE_CONFIG_FILE, "r") as f:
                 date_config = json.load(f)
             
-            start_date = datetime.strptime(date_config["start_date"], "%Y-%m-%d")
-            end_date = datetime.strptime(date_config["end_date"], "%Y-%m-%d")
+            start_date = _parse_ymd(date_config["start_date"])
+            end_date = _parse_ymd(date_config["end_date"])
             
             return start_date, end_date
         except Exception as e:
@@ -123,13 +146,12 @@ class EnhancedCLI:
 
     def configure_date_range(self):
         """Configure the date range in the config file."""
-        date_config_file = os.path.join(config.CONFIG_DIR, "date_config.json")
         print(f"\n{Fore.YELLOW}Enter dates in format: YYYY-MM-DD{Style.RESET_ALL}")
         
         while True:
             try:
                 start_str = input(f"{Fore.CYAN}Start date:{Style.RESET_ALL} ").strip()
-                start_date = datetime.strptime(start_str, "%Y-%m-%d")
+                start_date = _parse_ymd(start_str)
                 break
             except ValueError:
                 print(f"{Fore.RED}Invalid date format. Please use YYYY-MM-DD{Style.RESET_ALL}")
@@ -137,7 +159,7 @@ class EnhancedCLI:
         while True:
             try:
                 end_str = input(f"{Fore.CYAN}End date:{Style.RESET_ALL} ").strip()
-                end_date = datetime.strptime(end_str, "%Y-%m-%d")
+                end_date = _parse_ymd(end_str)
                 
                 if end_date < start_date:
                     print(f"{Fore.RED}End date must be after start date{Style.RESET_ALL}")
@@ -152,7 +174,7 @@ class EnhancedCLI:
             "end_date": end_date.strftime("%Y-%m-%d")
         }
 
-        with open(date_config_file, "w") as f:
+        with open(config.DATE_CONFIG_FILE, "w") as f:
             json.dump(config_data, f, indent=4)
         
         print(f"{Fore.GREEN}Date range configuration saved successfully!{Style.RESET_ALL}")
@@ -203,18 +225,23 @@ class EnhancedCLI:
         """
         print(f"\n{Fore.GREEN}{message}{Style.RESET_ALL}")
 
-    def display_progress(self, total: int, desc: str = "Progress") -> tqdm:
+    def display_progress(
+        self, total: int, desc: str = "Progress", position: Optional[int] = None
+    ) -> tqdm:
         """
         Create and return a progress bar.
         
         Args:
             total: Total number of items.
             desc: Progress bar description.
+            position: Line of the bar when several are shown at once.
             
         Returns:
             tqdm: Progress bar instance.
         """
-        return tqdm(total=total, desc=desc, ncols=100)
+        # Callers advance per batch; redraw at most twice a second, like the
+        # bars in GmailService
+        return tqdm(total=total, desc=desc, ncols=100, mininterval=0.5, position=position)
 
     def get_auth_method(self) -> str:
         """
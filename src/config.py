@@ -1,6 +1,7 @@
 """
 Configuration settings for the Gmail Export Tool.
 """
+import logging
 import os
 import sys
 
@@ -23,10 +24,17 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 TOKENS_DIR = os.path.join(DATA_DIR, "tokens")
 EXPORTS_DIR = os.path.join(DATA_DIR, "exports")
 CONFIG_DIR = os.path.join(DATA_DIR, "config")
+CACHE_DIR = os.path.join(DATA_DIR, "cache")  # Message metadata, see CACHE_MESSAGES
+PROFILES_DIR = os.path.join(DATA_DIR, "profiles")  # Only used with --profile
 
 # File paths
 ACCOUNTS_FILE = os.path.join(CONFIG_DIR, "email_accounts.json")
 CREDENTIALS_FILE = os.path.join(CONFIG_DIR, "credentials.json")
+DATE_CONFIG_FILE = os.path.join(CONFIG_DIR, "date_config.json")
+
+# Logging, configured once by the entry point (src.main / src.gui)
+LOG_LEVEL = logging.INFO
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
 
 # Date format for user input
 DATE_FORMAT = "%Y-%m-%d"
@@ -34,4 +42,10 @@ DATE_FORMAT_DISPLAY = "YYYY-MM-DD"
 
 # Export settings
 EXCEL_EXTENSION = ".xlsx"
-EXCEL_FILENAME_FORMAT = "sent_emails_{start_date}_{end_date}"  # Will be formatted with dates 
\ No newline at end of file
+EXCEL_FILENAME_FORMAT = "sent_emails_{start_date}_{end_date}"  # Will be formatted with dates 
+EXPORT_SEGMENT_ROWS = 250_000  # Larger exports are split into _partNN files
+
+# Keep the date, recipient and subject of fetched messages in CACHE_DIR so
+# repeat exports only download new messages. Off by default: the cache is
+# an unbounded plaintext copy of mail metadata outside the exports.
+CACHE_MESSAGES = False
\ No newline at end of file
@@ -2,59 +2,460 @@
 Export operations for the Gmail Export Tool.
 """
 import logging
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import pandas as pd
 from datetime import datetime
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl import Workbook
+from openpyxl.writer.excel import ExcelWriter
+from openpyxl.cell import WriteOnlyCell
+import io
+import multiprocessing
 import os
+import re
+import threading
+import zipfile
+from xml.sax.saxutils import escape
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+from src import config
+
+
+# Format GmailService uses for the Date field, and the value written when
+# a message has no usable date
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+DEFAULT_DATE = pd.Timestamp("1900-01-01 00:00:00")
+
+# Exports with fewer rows than this are sorted in plain Python; below this
+# size building a DataFrame costs more than the work it does
+SMALL_EXPORT_MAX_ROWS = 5_000
+_DATE_SHAPE_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\Z")
+
+# Exports with more rows than this bypass openpyxl and stream the sheet XML
+FAST_XML_MIN_ROWS = 50_000
+
+# Deflate level for the xlsx zip container; level 1 is several times faster
+# than zlib's default of 6 for a modestly larger file
+ZIP_COMPRESSLEVEL = 1
+
+# Export workers are spawned, not forked: they are started while other
+# threads (fetches, spinners) may hold logging or HTTP locks that a forked
+# child would inherit in a locked state
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+# openpyxl style objects are immutable, so they are built once and shared
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+_CELL_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+
+# Characters XML 1.0 does not allow in text nodes
+_ILLEGAL_XML_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
 )
 
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{title}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+# Style 0 is the default; style 1 matches the openpyxl header style
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Calibri"/></font>'
+    '</fonts>'
+    '<fills count="3">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FF366092"/><bgColor rgb="FF366092"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="2">'
+    '<border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border><left style="thin"/><right style="thin"/><top style="thin"/>'
+    '<bottom style="thin"/><diagonal/></border>'
+    '</borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="0" applyFont="1" '
+    'applyFill="1" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+def _xml_text(value: str) -> str:
+    """Escape a string for use as XML text, dropping characters XML forbids."""
+    return escape(_ILLEGAL_XML_CHARS_RE.sub("", value), {'"': "&quot;"})
+
+
+def _init_worker_logging(level: int, log_format: str):
+    """Configure logging in a spawned worker, which starts with none."""
+    logging.basicConfig(level=level, format=log_format)
+
+
+def _export_one(job: Tuple[list, str, str]) -> bool:
+    """Run a single export; module-level so worker processes can pickle it."""
+    return ExportManager().export_to_excel(*job)
+
+
 class ExportManager:
     """Handles export operations for email data."""
 
     def __init__(self):
         """Initialize the export manager."""
         self.logger = logging.getLogger(__name__)
+        # Worker processes for export_in_process, started on first use
+        self._process_pool = None
+        self._pool_lock = threading.Lock()
 
-    def _clean_date(self, date_str: str) -> str:
-        """Clean and validate date string."""
-        if not date_str or date_str == "No Date":
-            return "1900-01-01 00:00:00"  # Default date for invalid entries
-        try:
-            # Try to parse and reformat the date
-            dt = pd.to_datetime(date_str)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
-            return "1900-01-01 00:00:00"  # Default date for parsing errors
-
-    def _validate_data(self, emails_data: list) -> list:
-        """Validate and clean email data before export."""
-        cleaned_data = []
+    @staticmethod
+    def _clean_dates(dates: pd.Series) -> pd.Series:
+        """
+        Parse a column of date strings in one vectorized pass.
+
+        Dates produced by GmailService share one fixed format, which pandas
+        parses in C. Only entries that do not match fall back to per-value
+        format inference. Missing or unparseable dates become 1900-01-01.
+
+        Args:
+            dates: Series of date strings.
+
+        Returns:
+            pd.Series: Series of datetime64 values.
+        """
+        parsed = pd.to_datetime(dates, format=DATE_FORMAT, errors='coerce')
+        retry = parsed.isna() & dates.notna() & (dates != "No Date")
+        if retry.any():
+            try:
+                fallback = pd.to_datetime(dates[retry], format="mixed", errors='coerce')
+                parsed[retry] = fallback.dt.tz_localize(None) if fallback.dt.tz else fallback
+            except Exception:
+                pass  # Leave them as NaT; they get the default date below
+        return parsed.fillna(DEFAULT_DATE)
+
+    def _validate_data(self, emails_data: list) -> pd.DataFrame:
+        """
+        Validate and clean email data before export.
+
+        Args:
+            emails_data: List of email data dictionaries.
+
+        Returns:
+            pd.DataFrame: One row per email with Date, Email, Domain and
+            Subject filled in.
+        """
+        df = pd.DataFrame(emails_data)
+        for column in ("Date", "Username", "Domain", "Subject"):
+            if column not in df.columns:
+                df[column] = None
+
+        # Construct full email from Username and Domain
+        username = df["Username"].fillna("").astype(str)
+        domain = df["Domain"].fillna("").astype(str)
+        has_email = (username != "") & (domain != "")
+        df["Email"] = (username + "@" + domain).where(has_email, "No Email")
+
+        # Keep the original fields
+        df["Domain"] = domain.where(domain != "", "No Domain")
+        df["Subject"] = df["Subject"].fillna("No Subject")
+        df["Date"] = df["Date"].fillna("No Date")
+        return df
+
+    @staticmethod
+    def _column_widths(df: pd.DataFrame, columns: List[str]) -> Dict[str, int]:
+        """
+        Measure the widest value of each column, header included.
+
+        Args:
+            df: DataFrame holding the rows to export.
+            columns: Columns to measure.
+
+        Returns:
+            Dict[str, int]: Maximum string length per column.
+        """
+        widths = {}
+        for column in columns:
+            longest = df[column].astype(str).str.len().max()
+            widths[column] = max(len(column), 0 if pd.isna(longest) else int(longest))
+        return widths
+
+    def _prepare_rows(self, emails_data: list) -> List[Tuple[str, str, str, str]]:
+        """
+        Clean and sort a small export without going through pandas.
+
+        Dates already in DATE_FORMAT sort correctly as strings, so only
+        the odd ones out are handed to _clean_dates.
+
+        Args:
+            emails_data: List of email data dictionaries.
+
+        Returns:
+            List[Tuple[str, str, str, str]]: (Date, Email, Domain, Subject)
+            rows sorted by date.
+        """
+        rows = []
+        odd_dates = {}
         for email in emails_data:
-            cleaned_email = email.copy()
-            # Clean date
-            cleaned_email['Date'] = self._clean_date(email.get('Date', 'No Date'))
-            
-            # Construct full email from Username and Domain
-            username = email.get('Username', '')
-            domain = email.get('Domain', '')
-            if username and domain:
-                cleaned_email['Email'] = f"{username}@{domain}"
+            date = email.get('Date', 'No Date')
+            if not isinstance(date, str) or _DATE_SHAPE_RE.match(date) is None:
+                odd_dates.setdefault(date, None)
             else:
-                cleaned_email['Email'] = "No Email"
-            
-            # Keep the original fields
-            cleaned_email['Domain'] = domain if domain else "No Domain"
-            cleaned_email['Subject'] = email.get('Subject', 'No Subject')
-            
-            cleaned_data.append(cleaned_email)
-        return cleaned_data
+                try:
+                    datetime.fromisoformat(date)
+                except ValueError:
+                    odd_dates.setdefault(date, None)
+
+            username = email.get('Username') or ''
+            domain = email.get('Domain') or ''
+            subject = email.get('Subject')
+            rows.append((
+                date,
+                f"{username}@{domain}" if username and domain else "No Email",
+                domain or "No Domain",
+                "No Subject" if subject is None else subject,
+            ))
+
+        if odd_dates:
+            raw = list(odd_dates)
+            cleaned = self._clean_dates(pd.Series(raw, dtype=object)).dt.strftime(DATE_FORMAT)
+            odd_dates = dict(zip(raw, cleaned))
+            rows = [
+                (odd_dates[row[0]], *row[1:]) if row[0] in odd_dates else row
+                for row in rows
+            ]
+
+        rows.sort(key=lambda row: row[0])
+        return rows
+
+    def _write_workbook(
+        self, rows: Iterable[tuple], columns: List[str], widths: Dict[str, int],
+        output_file: str, email: str
+    ):
+        """
+        Write the export with an openpyxl write-only workbook.
+
+        Args:
+            rows: Sorted row tuples, one value per column.
+            columns: Columns to write, in order.
+            widths: Maximum string length per column.
+            output_file: Path to output Excel file.
+            email: Email address being exported.
+        """
+        # Create a write-only workbook; rows are streamed to disk as
+        # they are appended instead of being held as Cell objects
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(title=f"Sent Emails - {email}")
+
+        # Column widths must be set before any row is written
+        for col_idx, column in enumerate(columns, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = widths[column] + 2
+
+        # Register the header style once; every header cell then refers
+        # to it by name instead of carrying its own style objects
+        header_style = NamedStyle(
+            name="header",
+            font=_HEADER_FONT,
+            fill=_HEADER_FILL,
+            alignment=_HEADER_ALIGN,
+            border=_CELL_BORDER,
+        )
+        wb.add_named_style(header_style)
+
+        # Write headers
+        header_cells = []
+        for header in columns:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = "header"
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Write data
+        for row in rows:
+            ws.append(row)
+
+        # Build the package in memory and hand it to the OS in one write;
+        # openpyxl otherwise issues many small writes per zip entry
+        # (same as wb.save, but with a cheaper compression level)
+        buffer = io.BytesIO()
+        archive = zipfile.ZipFile(
+            buffer, "w", zipfile.ZIP_DEFLATED,
+            allowZip64=True, compresslevel=ZIP_COMPRESSLEVEL
+        )
+        ExcelWriter(wb, archive).save()
+        wb.close()  # Explicitly close the workbook
+        with open(output_file, "wb") as f:
+            f.write(buffer.getbuffer())
+
+    def _export_fast_xml(
+        self, df: pd.DataFrame, columns: List[str], widths: Dict[str, int],
+        output_file: str, email: str
+    ):
+        """
+        Write the export as a minimal XLSX package without openpyxl.
+
+        The worksheet XML is generated directly with inline strings, so no
+        per-cell objects or shared-string table are built. The header gets
+        the same styling as the openpyxl path.
+
+        Args:
+            df: Sorted DataFrame holding the rows to export.
+            columns: Columns to write, in order.
+            widths: Maximum string length per column.
+            output_file: Path to output Excel file.
+            email: Email address being exported.
+        """
+        letters = [get_column_letter(i) for i in range(1, len(columns) + 1)]
+
+        with zipfile.ZipFile(
+            output_file, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL
+        ) as archive:
+            archive.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+            archive.writestr("_rels/.rels", _ROOT_RELS_XML)
+            archive.writestr(
+                "xl/workbook.xml",
+                _WORKBOOK_XML.format(title=_xml_text(f"Sent Emails - {email}")),
+            )
+            archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+            archive.writestr("xl/styles.xml", _STYLES_XML)
+
+            with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as raw:
+                sheet = io.TextIOWrapper(raw, encoding="utf-8")
+                sheet.write(
+                    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><cols>'
+                )
+                for col_idx, column in enumerate(columns, 1):
+                    sheet.write(
+                        f'<col min="{col_idx}" max="{col_idx}" '
+                        f'width="{widths[column] + 2}" customWidth="1"/>'
+                    )
+                sheet.write("</cols><sheetData>")
+
+                header = "".join(
+                    f'<c r="{letter}1" t="inlineStr" s="1"><is><t>{_xml_text(name)}</t></is></c>'
+                    for letter, name in zip(letters, columns)
+                )
+                sheet.write(f'<row r="1">{header}</row>')
+
+                for row_idx, row in enumerate(
+                    df[columns].itertuples(index=False, name=None), 2
+                ):
+                    cells = "".join(
+                        f'<c r="{letter}{row_idx}" t="inlineStr"><is>'
+                        f'<t xml:space="preserve">{_xml_text(value)}</t></is></c>'
+                        for letter, value in zip(letters, row)
+                        if isinstance(value, str) and value
+                    )
+                    sheet.write(f'<row r="{row_idx}">{cells}</row>')
+
+                sheet.write("</sheetData></worksheet>")
+                sheet.flush()
+                sheet.detach()
+
+    @staticmethod
+    def output_files(output_file: str, row_count: int) -> List[str]:
+        """
+        Get the files an export of row_count emails is written to.
+
+        Exports of up to config.EXPORT_SEGMENT_ROWS rows go to output_file
+        itself; larger ones are split into <name>_part01.xlsx,
+        <name>_part02.xlsx, ... next to it.
+
+        Args:
+            output_file: Path passed to export_to_excel.
+            row_count: Number of emails being exported.
+
+        Returns:
+            List[str]: Paths of the files written, in date order.
+        """
+        segment_rows = config.EXPORT_SEGMENT_ROWS
+        if row_count <= segment_rows:
+            return [output_file]
+
+        base, ext = os.path.splitext(output_file)
+        parts = -(-row_count // segment_rows)
+        return [f"{base}_part{part:02d}{ext}" for part in range(1, parts + 1)]
+
+    def _write_file(
+        self, df: Optional[pd.DataFrame], rows: Iterable[tuple], columns: List[str],
+        widths: Dict[str, int], output_file: str, email: str
+    ):
+        """
+        Write one workbook, picking the writer by size.
+
+        The file is written to a temp path and swapped in atomically, so
+        readers never see a partial workbook and a failed export leaves no
+        debris.
+
+        Args:
+            df: Sorted DataFrame holding the rows, or None for small exports.
+            rows: The same rows as tuples, in column order.
+            columns: Columns to write, in order.
+            widths: Maximum string length per column.
+            output_file: Path to output Excel file.
+            email: Email address being exported.
+        """
+        tmp_file = output_file + ".tmp"
+        try:
+            # Large exports skip openpyxl and write the sheet XML directly
+            if df is not None and len(df) > FAST_XML_MIN_ROWS:
+                self._export_fast_xml(df, columns, widths, tmp_file, email)
+            else:
+                self._write_workbook(rows, columns, widths, tmp_file, email)
+            os.replace(tmp_file, output_file)
+        except Exception:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
 
     def export_to_excel(self, emails_data: list, output_file: str, email: str) -> bool:
         """
@@ -76,71 +477,115 @@ class ExportManager:
             # Ensure the export directory exists
             os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-            # Clean and validate data
-            cleaned_data = self._validate_data(emails_data)
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(cleaned_data)
-            
-            # Ensure all dates are in datetime format
-            df["Date"] = pd.to_datetime(df["Date"], format="%Y-%m-%d %H:%M:%S", errors='coerce')
-            
-            # Remove any rows where date conversion failed
-            df = df.dropna(subset=["Date"])
-            
-            # Sort by date
-            df = df.sort_values("Date")
-            
-            # Convert back to string format for Excel
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d %H:%M:%S")
+            columns = ["Date", "Email", "Domain", "Subject"]
 
-            # Create a new workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = f"Sent Emails - {email}"
+            df = None
+            if len(emails_data) < SMALL_EXPORT_MAX_ROWS:
+                # Small exports: plain Python sort, no DataFrame
+                rows = self._prepare_rows(emails_data)
+                widths = {
+                    column: max([len(column)] + [len(str(row[idx])) for row in rows])
+                    for idx, column in enumerate(columns)
+                }
+            else:
+                # Clean and validate data
+                df = self._validate_data(emails_data)
+                
+                # Parse all dates at once; invalid ones get the default date
+                df["Date"] = self._clean_dates(df["Date"])
+                
+                # Sort by date
+                df = df.sort_values("Date")
+                
+                # Convert back to string format for Excel
+                df["Date"] = df["Date"].dt.strftime(DATE_FORMAT)
 
-            # Write headers
-            columns = ["Date", "Email", "Domain", "Subject"]
-            for col, header in enumerate(columns, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
+                rows = df[columns].itertuples(index=False, name=None)
+                widths = self._column_widths(df, columns)
 
-            # Write data
-            for row_idx, row in enumerate(df[columns].values, 2):
-                for col_idx, value in enumerate(row, 1):
-                    cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                    cell.alignment = Alignment(horizontal="left")
-
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column = [cell for cell in column]
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[get_column_letter(column[0].column)].width = adjusted_width
-
-            # Save the workbook
-            if os.path.exists(output_file):
-                os.remove(output_file)  # Remove existing file to avoid corruption
-            wb.save(output_file)
-            wb.close()  # Explicitly close the workbook
-            
-            self.logger.info(f"Successfully exported {len(emails_data)} emails to {output_file}")
+            part_files = self.output_files(output_file, len(emails_data))
+            if len(part_files) == 1:
+                self._write_file(df, rows, columns, widths, output_file, email)
+                self.logger.info(f"Successfully exported {len(emails_data)} emails to {output_file}")
+                return True
+
+            # Very large exports are split into date-ordered parts so each
+            # file stays quick to write and to open in Excel
+            segment_rows = config.EXPORT_SEGMENT_ROWS
+            for part, part_file in enumerate(part_files):
+                start = part * segment_rows
+                if df is None:
+                    part_df, part_rows = None, rows[start:start + segment_rows]
+                else:
+                    part_df = df.iloc[start:start + segment_rows]
+                    part_rows = part_df[columns].itertuples(index=False, name=None)
+                self._write_file(part_df, part_rows, columns, widths, part_file, email)
+                self.logger.info(f"Exported part {part + 1} of {len(part_files)} to {part_file}")
+
+            self.logger.info(f"Successfully exported {len(emails_data)} emails in {len(part_files)} parts")
             return True
             
         except Exception as e:
             self.logger.error(f"Error exporting to Excel: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
+
+    def export_many(self, jobs: List[Tuple[list, str, str]]) -> List[bool]:
+        """
+        Export several accounts in parallel, one process per export.
+
+        Each job writes its own file, so the workers share nothing.
+
+        Args:
+            jobs: (emails_data, output_file, email) tuples, as passed to
+                export_to_excel.
+
+        Returns:
+            List[bool]: Result of each export, in job order.
+        """
+        if len(jobs) <= 1:
+            return [self.export_to_excel(*job) for job in jobs]
+
+        workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=_POOL_CONTEXT,
+            initializer=_init_worker_logging,
+            initargs=(config.LOG_LEVEL, config.LOG_FORMAT),
+        ) as executor:
+            return list(executor.map(_export_one, jobs))
+
+    def export_in_process(self, emails_data: list, output_file: str, email: str) -> bool:
+        """
+        Run export_to_excel in a worker process instead of this thread.
+
+        Threads exporting several accounts at once would otherwise take
+        turns holding the GIL while serializing the workbook. Safe to call
+        from several threads; they share one pool of processes.
+
+        Args:
+            emails_data: List of email data dictionaries.
+            output_file: Path to output Excel file.
+            email: Email address being exported.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        with self._pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1, mp_context=_POOL_CONTEXT,
+                    initializer=_init_worker_logging,
+                    initargs=(config.LOG_LEVEL, config.LOG_FORMAT),
+                )
+            pool = self._process_pool
+
+        try:
+            return pool.submit(_export_one, (emails_data, output_file, email)).result()
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # Start a fresh pool on the next export
+                with self._pool_lock:
+                    if self._process_pool is pool:
+                        self._process_pool = None
+            # The pool itself failed (e.g. a worker died); export right here
+            self.logger.error(f"Error exporting in worker process: {str(e)}")
+            return self.export_to_excel(emails_data, output_file, email)
@@ -3,16 +3,28 @@ File management operations for the Gmail Export Tool.
 """
 import os
 import logging
+from functools import lru_cache
 from datetime import datetime
 from src import config
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+
+@lru_cache(maxsize=1024)
+def _token_filename(email: str, extension: str = ".json") -> str:
+    """Token file name for an email address."""
+    return f'token_{email.replace("@", "_at_")}{extension}'
+
+
+@lru_cache(maxsize=1024)
+def _export_folder_name(email: str) -> str:
+    """Sanitized export folder name for an email address."""
+    return email.replace("@", "_at_").replace(".", "_")
+
 
 class FileManager:
     """Handles all file and directory operations for the application."""
+
+    # Set once the directory tree exists so later instances skip the checks
+    _dirs_created = False
     
     def __init__(self):
         """Initialize the FileManager with required directories."""
@@ -21,14 +33,20 @@ class FileManager:
 
     def create_directory_structure(self):
         """Create necessary directories if they don't exist."""
+        if FileManager._dirs_created:
+            return
+
         directories = [
             config.DATA_DIR,
             config.TOKENS_DIR,
             config.EXPORTS_DIR,
             config.CONFIG_DIR,
+            config.CACHE_DIR,
         ]
         
         for directory in directories:
+            if os.path.isdir(directory):
+                continue
             try:
                 os.makedirs(directory, exist_ok=True)
                 self.logger.debug(f"Directory ensured: {directory}")
@@ -39,6 +57,8 @@ class FileManager:
                 self.logger.error(f"Error creating directory {directory}: {str(e)}")
                 raise
 
+        FileManager._dirs_created = True
+
     def get_token_path(self, email: str) -> str:
         """
         Get path for token file.
@@ -52,8 +72,39 @@ class FileManager:
         if not email:
             raise ValueError("Email address cannot be empty")
             
-        filename = f'token_{email.replace("@", "_at_")}.pickle'
-        return os.path.join(config.TOKENS_DIR, filename)
+        return os.path.join(config.TOKENS_DIR, _token_filename(email))
+
+    def get_legacy_token_path(self, email: str) -> str:
+        """
+        Get path of the pickle token file used by older versions.
+        
+        Args:
+            email: Email address to generate token path for.
+            
+        Returns:
+            str: Full path to the legacy token file.
+        """
+        if not email:
+            raise ValueError("Email address cannot be empty")
+
+        return os.path.join(config.TOKENS_DIR, _token_filename(email, ".pickle"))
+
+    def get_message_cache_path(self, email: str) -> str:
+        """
+        Get path of the cached message metadata for an account.
+        
+        Args:
+            email: Email address the cache belongs to.
+            
+        Returns:
+            str: Full path to the cache file.
+        """
+        if not email:
+            raise ValueError("Email address cannot be empty")
+
+        # Escaped like token file names; the export folder name maps both
+        # "." and "_" to "_", so two accounts could end up sharing a cache
+        return os.path.join(config.CACHE_DIR, f'messages_{email.replace("@", "_at_")}.json')
 
     def get_export_path(self, email: str, start_date: datetime, end_date: datetime) -> str:
         """
@@ -71,8 +122,7 @@ class FileManager:
             raise ValueError("Email address cannot be empty")
         
         # Create a sanitized email folder name
-        email_folder_name = email.replace("@", "_at_").replace(".", "_")
-        email_export_dir = os.path.join(config.EXPORTS_DIR, email_folder_name)
+        email_export_dir = os.path.join(config.EXPORTS_DIR, _export_folder_name(email))
         
         # Create the email-specific export directory if it doesn't exist
         os.makedirs(email_export_dir, exist_ok=True)
@@ -101,6 +151,25 @@ class FileManager:
             self.logger.warning("Credentials file not found!")
         return exists
 
+    def cleanup_message_cache(self, email: str) -> bool:
+        """
+        Remove cached message metadata for a given email.
+        
+        Args:
+            email: Email address whose cache should be removed.
+            
+        Returns:
+            bool: True if a cache file was removed, False otherwise.
+        """
+        cache_path = self.get_message_cache_path(email)
+        try:
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+                return True
+        except Exception as e:
+            self.logger.error(f"Error removing message cache for {email}: {str(e)}")
+        return False
+
     def cleanup_token(self, email: str) -> bool:
         """
         Remove token file for a given email.
@@ -111,12 +180,14 @@ class FileManager:
         Returns:
             bool: True if successful, False otherwise.
         """
-        token_path = self.get_token_path(email)
-        try:
-            if os.path.exists(token_path):
-                os.remove(token_path)
-                self.logger.info(f"Token removed for {email}")
-                return True
-        except Exception as e:
-            self.logger.error(f"Error removing token for {email}: {str(e)}")
-        return False 
\ No newline at end of file
+        removed = False
+        for token_path in (self.get_token_path(email), self.get_legacy_token_path(email)):
+            try:
+                if os.path.exists(token_path):
+                    os.remove(token_path)
+                    removed = True
+            except Exception as e:
+                self.logger.error(f"Error removing token for {email}: {str(e)}")
+        if removed:
+            self.logger.info(f"Token removed for {email}")
+        return removed 
\ No newline at end of file
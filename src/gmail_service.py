@@ -3,35 +3,180 @@ Gmail API service operations for the Gmail Export Tool.
 """
 
 import os
+import json
 import pickle
 import logging
-import re
 from datetime import datetime
-from typing import List, Dict, Any, Tuple, Generator
+from typing import List, Dict, Any, Callable, Tuple, Generator, Optional
 from tqdm import tqdm
 import base64
-from email.utils import parsedate_to_datetime
+from email.utils import parsedate_tz
 import time
+import random
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import imaplib
-import email
 from email.header import decode_header
+from email.parser import BytesHeaderParser
 
+import httplib2
+from google.auth.exceptions import TransportError
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
 from src import config
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
 
 # Constants for API limits
-MAX_RESULTS_PER_PAGE = 10000
-MAX_RETRIES = 3
-RETRY_DELAY = 1  # seconds
+MAX_RESULTS_PER_PAGE = 500  # Largest page messages().list() returns
+MAX_RETRIES = 5
+RETRY_DELAY = 1  # seconds, doubled on each retry
+MAX_RETRY_DELAY = 60  # seconds
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = ("ratelimitexceeded", "userratelimitexceeded", "quotaexceeded")
+# Connection resets, timeouts and DNS failures; socket.timeout is an OSError
+TRANSIENT_ERRORS = (OSError, httplib2.HttpLib2Error, TransportError)
+BATCH_SIZE = 100  # Gmail accepts at most 100 calls per batch request
+ACCOUNT_WORKERS = 4  # Accounts fetched at once by fetch_all_accounts
+FETCH_WORKERS = 4  # Batch requests kept in flight at once per account
+
+# Only these headers are read, so messages are fetched as metadata and the
+# responses trimmed to the fields actually used
+METADATA_HEADERS = ["To", "Date", "Subject"]
+MESSAGE_FIELDS = "id,payload/headers"
+LIST_FIELDS = "messages/id,nextPageToken,resultSizeEstimate"
+# Same for IMAP: PEEK also leaves the \Seen flag alone
+IMAP_HEADER_FETCH = "(BODY.PEEK[HEADER.FIELDS (TO DATE SUBJECT)])"
+IMAP_FETCH_CHUNK = 500  # UIDs per UID FETCH, keeps command lines short
+
+# Gmail allows 250 quota units per user per second; list and get cost 5 each
+QUOTA_UNITS_PER_SECOND = 250
+LIST_QUOTA_COST = 5
+GET_QUOTA_COST = 5
+
+
+def _format_date(date_str: Optional[str]) -> Optional[str]:
+    """
+    Convert an RFC 2822 Date header to "YYYY-MM-DD HH:MM:SS".
+
+    The sender's wall-clock time is kept, as before. parsedate_tz is used
+    directly so no timezone-aware datetime has to be built and formatted.
+
+    Args:
+        date_str: Value of the Date header.
+
+    Returns:
+        Optional[str]: Formatted date, or None if missing or unparseable.
+    """
+    if not date_str:
+        return None
+    try:
+        parsed = parsedate_tz(date_str)
+        if parsed is None:
+            return None
+        datetime(*parsed[:6])  # Reject impossible dates such as 31 Feb
+    except Exception:
+        return None
+    return "%04d-%02d-%02d %02d:%02d:%02d" % parsed[:6]
+
+
+@lru_cache(maxsize=4096)
+def _split_email(email: str) -> Tuple[str, str]:
+    """
+    Split email address into username and domain.
+
+    Memoized: sent mail tends to go to the same few recipients over and
+    over, and the result depends on the string alone.
+
+    Args:
+        email: Email address to split.
+
+    Returns:
+        Tuple[str, str]: Username and domain parts.
+    """
+    try:
+        # Handle multiple email addresses: take only the first one
+        comma = email.find(",")
+        if comma != -1:
+            email = email[:comma].strip()
+
+        # Extract email from format like '"Name" <email@domain.com>'
+        lt = email.rfind("<")
+        if lt != -1:
+            gt = email.find(">", lt + 1)
+            address = email[lt + 1:] if gt == -1 else email[lt + 1:gt]
+            if "@" in address:
+                email = address
+        email = email.strip()
+
+        # Split at @ symbol
+        username, sep, domain = email.partition("@")
+        if sep and "@" not in domain:
+            return username.strip(), domain.strip()
+        return email, ""  # Return original as username if not valid email format
+    except Exception:
+        return email, ""  # Return original as username in case of any error
+
+
+def _authorized_http(credentials: Credentials) -> AuthorizedHttp:
+    """
+    Build a keep-alive HTTP connection authorized with the credentials.
+
+    build_http() keeps googleapiclient's default socket timeout. Responses
+    are gzip-compressed: httplib2 sends Accept-Encoding: gzip and
+    googleapiclient adds "(gzip)" to the User-Agent, which Google requires.
+    """
+    return AuthorizedHttp(credentials, http=build_http())
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces calls to an average rate."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens the bucket holds.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cost: float = 1):
+        """
+        Take tokens from the bucket, sleeping until enough are available.
+
+        A cost larger than the capacity is let through once the bucket is
+        full and leaves it in debt, so the average rate still holds.
+
+        Args:
+            cost: Number of tokens to take.
+        """
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                needed = min(cost, self.capacity) - self._tokens
+                if needed <= 0:
+                    self._tokens -= cost
+                    return
+                time.sleep(needed / self.rate)
+
 
 class GmailService:
     """Handles all Gmail API operations."""
@@ -49,39 +194,18 @@ class GmailService:
         self.account_manager = account_manager
         self.imap_server = "imap.gmail.com"
         self.imap_port = 993
-
-    @staticmethod
-    def _split_email(email: str) -> Tuple[str, str]:
-        """
-        Split email address into username and domain.
-
-        Args:
-            email: Email address to split.
-
-        Returns:
-            Tuple[str, str]: Username and domain parts.
-        """
-        try:
-            # Handle multiple email addresses
-            if "," in email:
-                # Take only the first email address
-                email = email.split(",")[0].strip()
-
-            # Extract email from format like '"Name" <email@domain.com>'
-            email_pattern = r"<?([^<]*@[^>]*)>?"
-            match = re.search(email_pattern, email)
-            if match:
-                email = match.group(1).strip()
-
-            # Split at @ symbol
-            parts = email.split("@")
-            if len(parts) == 2:
-                username = parts[0].strip()
-                domain = parts[1].strip()
-                return username, domain
-            return email, ""  # Return original as username if not valid email format
-        except Exception:
-            return email, ""  # Return original as username in case of any error
+        # httplib2 connections are not thread-safe, so each fetch thread
+        # gets its own authorized connection
+        self._local = threading.local()
+        # One rate limiter per service (i.e. per account), shared by all of
+        # that account's fetch threads; Gmail's quota is per user. Services
+        # are weak keys, so entries go when a rebuilt service replaces one
+        self._buckets = weakref.WeakKeyDictionary()
+        self._buckets_lock = threading.Lock()
+        # Built services by email, reused while their credentials are valid
+        self._service_cache: Dict[str, Any] = {}
+        # Account each built service belongs to, for the message cache
+        self._service_emails = weakref.WeakKeyDictionary()
 
     def setup_service(self, email: str):
         """
@@ -97,19 +221,32 @@ class GmailService:
             FileNotFoundError: If credentials file is missing.
             ValueError: If email is invalid or not registered.
         """
-        if not self.account_manager.get_account_token_path(email):
+        token_file = self.account_manager.get_account_token_path(email)
+        if not token_file:
             raise ValueError(f"Email {email} not registered")
 
+        # A missing token file means the account was removed (and possibly
+        # added again) since the service was built, so it is not reused
+        service = self._service_cache.get(email)
+        if (
+            service is not None
+            and service._http.credentials.valid
+            and os.path.exists(token_file)
+        ):
+            return service
+
         creds = None
-        token_file = self.account_manager.get_account_token_path(email)
 
         # Load existing credentials
         if os.path.exists(token_file):
             try:
-                with open(token_file, "rb") as token:
-                    creds = pickle.load(token)
+                creds = Credentials.from_authorized_user_file(
+                    token_file, config.GMAIL_API_SCOPES
+                )
             except Exception as e:
                 self.logger.error(f"Error loading credentials: {str(e)}")
+        else:
+            creds = self._migrate_legacy_token(email, token_file)
 
         # Refresh or create new credentials
         try:
@@ -128,149 +265,335 @@ class GmailService:
                     creds = flow.run_local_server(port=0)
 
                 # Save credentials
-                with open(token_file, "wb") as token:
-                    pickle.dump(creds, token)
+                with open(token_file, "w") as token:
+                    token.write(creds.to_json())
         except Exception as e:
+            # Forget a cached service whose token could not be refreshed
+            self._service_cache.pop(email, None)
             self.logger.error(f"Error setting up credentials: {str(e)}")
             raise
 
-        return build("gmail", "v1", credentials=creds)
+        # One keep-alive connection is reused for every call on the service
+        # The discovery document bundled with googleapiclient is used, so
+        # building the service costs no network fetch or cache-file read
+        service = build(
+            "gmail", "v1", http=_authorized_http(creds),
+            static_discovery=True, cache_discovery=False
+        )
+        self._service_cache[email] = service
+        self._service_emails[service] = email
+        return service
 
-    def get_sent_emails(
-        self, service: Any, start_date: datetime, end_date: datetime
-    ) -> List[Dict]:
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """
+        Tell whether a failed API call is worth retrying.
+
+        Args:
+            error: Exception raised by the call.
+
+        Returns:
+            bool: True for rate limiting, server errors and network errors.
+            Anything else (revoked grants, programming errors) fails at once.
+        """
+        if not isinstance(error, HttpError):
+            return isinstance(error, TRANSIENT_ERRORS)
+        status = error.resp.status
+        if status in RETRYABLE_STATUSES:
+            return True
+        return status == 403 and any(
+            reason in str(error).lower() for reason in RATE_LIMIT_REASONS
+        )
+
+    @staticmethod
+    def _retry_delay(attempt: int, error: Exception = None) -> float:
         """
-        Fetch sent emails between specified dates.
+        Get how long to wait before the next retry.
+
+        Honours a Retry-After header when the server sends one, otherwise
+        backs off exponentially with jitter.
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed.
+            error: Exception raised by the failed attempt.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        if isinstance(error, HttpError):
+            retry_after = error.resp.get("retry-after")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), MAX_RETRY_DELAY)
+        return min(MAX_RETRY_DELAY, RETRY_DELAY * 2 ** attempt) + random.uniform(0, 1)
+
+    def _bucket_for(self, service: Any) -> TokenBucket:
+        """
+        Get the rate limiter for a service, creating it on first use.
 
         Args:
             service: Gmail API service instance.
-            start_date: Start date for email fetch.
-            end_date: End date for email fetch.
 
         Returns:
-            List[Dict]: List of email data dictionaries.
+            TokenBucket: Rate limiter shared by all calls on the service.
         """
-        # Format dates for Gmail query
-        start_str = start_date.strftime("%Y/%m/%d")
-        end_str = end_date.strftime("%Y/%m/%d")
-        query = f"in:sent after:{start_str} before:{end_str}"
+        with self._buckets_lock:
+            bucket = self._buckets.get(service)
+            if bucket is None:
+                bucket = TokenBucket(QUOTA_UNITS_PER_SECOND, QUOTA_UNITS_PER_SECOND)
+                self._buckets[service] = bucket
+            return bucket
+
+    def _execute_with_retry(
+        self, request: Any, bucket: TokenBucket, cost: int = LIST_QUOTA_COST,
+        **execute_kwargs
+    ) -> Any:
+        """
+        Execute an API request, retrying transient failures with backoff.
 
-        try:
-            emails_data = []
-            page_token = None
-            total_processed = 0
+        Args:
+            request: Request object with an execute() method.
+            bucket: Rate limiter of the account the request is made for.
+            cost: Quota units the request uses, taken from the rate limiter
+                before each attempt.
+            **execute_kwargs: Arguments passed on to execute().
 
-            while True:
-                # Get list of messages with retries
-                for retry in range(MAX_RETRIES):
-                    try:
-                        results = (
-                            service.users()
-                            .messages()
-                            .list(
-                                userId="me",
-                                q=query,
-                                pageToken=page_token,
-                                maxResults=MAX_RESULTS_PER_PAGE
-                            )
-                            .execute()
-                        )
-                        break
-                    except Exception as e:
-                        if retry == MAX_RETRIES - 1:
-                            raise
-                        time.sleep(RETRY_DELAY)
-
-                messages = results.get("messages", [])
-                if not messages:
-                    break
-
-                with tqdm(total=len(messages), desc=f"Fetching emails (batch {total_processed + 1})") as pbar:
-                    for message in messages:
-                        try:
-                            msg = (
-                                service.users()
-                                .messages()
-                                .get(userId="me", id=message["id"])
-                                .execute()
-                            )
-
-                            headers = msg["payload"]["headers"]
-                            to_address = self._get_header(headers, "to", "No Recipient")
-                            username, domain = self._split_email(to_address)
-                            
-                            # Parse the date immediately
-                            date_str = self._get_header(headers, "date", None)
-                            if date_str:
-                                try:
-                                    parsed_date = parsedate_to_datetime(date_str)
-                                    # Convert to string in a consistent format
-                                    formatted_date = parsed_date.strftime("%Y-%m-%d %H:%M:%S")
-                                except Exception:
-                                    formatted_date = "No Date"
-                            else:
-                                formatted_date = "No Date"
+        Returns:
+            Any: The response of the request.
 
-                            email_data = {
-                                "Date": formatted_date,
-                                "Username": username,
-                                "Domain": domain,
-                                "Subject": self._get_header(
-                                    headers, "subject", "No Subject"
-                                ),
-                            }
-                            emails_data.append(email_data)
-                            pbar.update(1)
-                        except HttpError as e:
-                            self.logger.error(
-                                f"Error fetching message {message['id']}: {str(e)}"
-                            )
-                            if "quota" in str(e).lower():
-                                time.sleep(RETRY_DELAY)
-                        except Exception as e:
-                            self.logger.error(
-                                f"Unexpected error processing message: {str(e)}"
-                            )
+        Raises:
+            Exception: The last error, if it is not retryable or every
+                attempt failed.
+        """
+        for attempt in range(MAX_RETRIES):
+            bucket.acquire(cost)
+            try:
+                return request.execute(**execute_kwargs)
+            except Exception as e:
+                if attempt == MAX_RETRIES - 1 or not self._is_retryable(e):
+                    raise
+                delay = self._retry_delay(attempt, e)
+                self.logger.warning(f"Retrying request in {delay:.1f}s: {str(e)}")
+                time.sleep(delay)
 
-                total_processed += len(messages)
-                page_token = results.get("nextPageToken")
-                if not page_token:
-                    break
+    def _thread_http(self, service: Any):
+        """
+        Get this thread's authorized HTTP connection for the service.
 
-                # Small delay between batches to avoid rate limiting
-                time.sleep(0.1)
+        Args:
+            service: Gmail API service instance.
 
-            return emails_data
+        Returns:
+            AuthorizedHttp: Connection for this thread, or None if the service
+            carries no credentials (its own connection is used instead).
+        """
+        credentials = getattr(getattr(service, "_http", None), "credentials", None)
+        if credentials is None:
+            return None
+        http = getattr(self._local, "http", None)
+        if http is None or http.credentials is not credentials:
+            http = _authorized_http(credentials)
+            self._local.http = http
+        return http
+
+    def _fetch_batch(self, service: Any, message_ids: List[str]) -> List[Tuple[str, Dict]]:
+        """
+        Fetch up to BATCH_SIZE messages in one batch HTTP request.
 
-        except HttpError as e:
-            self.logger.error(f"Error accessing Gmail API: {str(e)}")
-            raise
+        Args:
+            service: Gmail API service instance.
+            message_ids: IDs of the messages to fetch.
+
+        Returns:
+            List[Tuple[str, Dict]]: (message id, message) pairs in request
+            order. Messages that failed are logged and left out.
+        """
+        responses = {}
+        pending = list(message_ids)
+        bucket = self._bucket_for(service)
+
+        for attempt in range(MAX_RETRIES):
+            last_attempt = attempt == MAX_RETRIES - 1
+            retry_ids = []
+            retry_error = None
+
+            def on_message(request_id, response, exception):
+                nonlocal retry_error
+                if exception is None:
+                    responses[request_id] = response
+                elif not last_attempt and self._is_retryable(exception):
+                    retry_ids.append(request_id)
+                    retry_error = exception
+                else:
+                    self.logger.error(
+                        f"Error fetching message {request_id}: {str(exception)}"
+                    )
+
+            batch = service.new_batch_http_request(callback=on_message)
+            for message_id in pending:
+                batch.add(
+                    service.users()
+                    .messages()
+                    .get(
+                        userId="me",
+                        id=message_id,
+                        format="metadata",
+                        metadataHeaders=METADATA_HEADERS,
+                        fields=MESSAGE_FIELDS,
+                    ),
+                    request_id=message_id,
+                )
+            bucket.acquire(GET_QUOTA_COST * len(pending))
+            try:
+                batch.execute(http=self._thread_http(service))
+            except Exception as e:
+                if last_attempt or not self._is_retryable(e):
+                    raise
+                retry_ids = [m for m in pending if m not in responses]
+                retry_error = e
+
+            if not retry_ids:
+                break
+            # Retry only the calls that were throttled or failed transiently
+            pending = retry_ids
+            delay = self._retry_delay(attempt, retry_error)
+            self.logger.warning(
+                f"Retrying {len(pending)} message(s) in {delay:.1f}s: {str(retry_error)}"
+            )
+            time.sleep(delay)
+
+        return [
+            (message_id, responses[message_id])
+            for message_id in message_ids
+            if message_id in responses
+        ]
+
+    def _migrate_legacy_token(self, email: str, token_file: str):
+        """
+        Convert a pickled token from older versions to the JSON format.
+
+        Args:
+            email: Email address the token belongs to.
+            token_file: Path the JSON token should be written to.
+
+        Returns:
+            Credentials: The migrated credentials, or None if there was no
+            legacy token or it could not be read.
+        """
+        legacy_file = self.file_manager.get_legacy_token_path(email)
+        if not os.path.exists(legacy_file):
+            return None
+
+        try:
+            # Only ever unpickles a file this tool wrote itself
+            with open(legacy_file, "rb") as token:
+                creds = pickle.load(token)
+            with open(token_file, "w") as token:
+                token.write(creds.to_json())
+            os.remove(legacy_file)
+            self.logger.info(f"Migrated token for {email} to JSON")
+            return creds
         except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
-            raise
+            self.logger.error(f"Error migrating legacy token for {email}: {str(e)}")
+            return None
 
     @staticmethod
-    def _get_header(headers: List[Dict], name: str, default: str = "") -> str:
+    def _build_query(start_date: datetime, end_date: datetime) -> str:
         """
-        Get header value from email headers.
+        Build the Gmail search query for sent mail in a date range.
 
         Args:
-            headers: List of email headers.
-            name: Name of the header to find.
-            default: Default value if header not found.
+            start_date: Start date for email range.
+            end_date: End date for email range.
 
         Returns:
-            str: Header value or default.
+            str: Query for messages().list().
+        """
+        return f"in:sent after:{start_date:%Y/%m/%d} before:{end_date:%Y/%m/%d}"
+
+    def _list_page(
+        self, service: Any, query: str, page_token: Optional[str] = None
+    ) -> Dict:
         """
-        return next(
-            (h["value"] for h in headers if h["name"].lower() == name.lower()), default
+        List one page of message IDs matching a query, with retries.
+
+        The rate limiter paces list calls, so no fixed delay is needed
+        between pages.
+
+        Args:
+            service: Gmail API service instance.
+            query: Gmail search query.
+            page_token: Token of the page to list; None for the first page.
+
+        Returns:
+            Dict: The list response, trimmed to LIST_FIELDS.
+        """
+        return self._execute_with_retry(
+            service.users()
+            .messages()
+            .list(
+                userId="me",
+                q=query,
+                pageToken=page_token,
+                maxResults=MAX_RESULTS_PER_PAGE,
+                fields=LIST_FIELDS,
+            ),
+            self._bucket_for(service),
         )
 
-    def get_total_messages(
+    @staticmethod
+    def _header_map(headers: List[Dict]) -> Dict[str, str]:
+        """
+        Index email headers by lower-cased name.
+
+        Args:
+            headers: List of email headers.
+
+        Returns:
+            Dict[str, str]: Header values by name; the first occurrence of a
+            repeated header wins.
+        """
+        return {h["name"].lower(): h["value"] for h in reversed(headers)}
+
+    def _load_message_cache(self, email: str) -> Dict[str, list]:
+        """
+        Load the metadata already fetched for an account.
+
+        Sent messages never change, so anything fetched once can be reused
+        by later exports of overlapping date ranges.
+
+        Args:
+            email: Email address of the account.
+
+        Returns:
+            Dict[str, list]: [Date, Username, Domain, Subject] by
+            message ID. Date is "No Date" for messages without a usable one.
+        """
+        cache_file = self.file_manager.get_message_cache_path(email)
+        try:
+            with open(cache_file, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.error(f"Error loading message cache for {email}: {str(e)}")
+            return {}
+
+    def _save_message_cache(self, email: str, cache: Dict[str, list]):
+        """Write an account's message cache, replacing the old file atomically."""
+        cache_file = self.file_manager.get_message_cache_path(email)
+        tmp_file = cache_file + ".tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(cache, f, separators=(",", ":"))
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            self.logger.error(f"Error saving message cache for {email}: {str(e)}")
+
+    def list_message_ids(
         self, service: Any, start_date: datetime, end_date: datetime
-    ) -> int:
+    ) -> List[str]:
         """
-        Get total count of messages in the specified date range.
+        List the IDs of all sent messages in the specified date range.
 
         Args:
             service: Gmail API service instance.
@@ -278,53 +601,55 @@ class GmailService:
             end_date: End date for email range.
 
         Returns:
-            int: Total number of messages.
+            List[str]: Message IDs, newest first.
         """
-        query = f'in:sent after:{start_date.strftime("%Y/%m/%d")} before:{end_date.strftime("%Y/%m/%d")}'
+        query = self._build_query(start_date, end_date)
+        message_ids = []
+        page_token = None
 
-        try:
-            total = 0
-            page_token = None
+        while True:
+            result = self._list_page(service, query, page_token)
+            message_ids.extend(message["id"] for message in result.get("messages", []))
 
-            while True:
-                # Get all message IDs with retries
-                for retry in range(MAX_RETRIES):
-                    try:
-                        result = (
-                            service.users()
-                            .messages()
-                            .list(
-                                userId="me",
-                                q=query,
-                                pageToken=page_token,
-                                maxResults=MAX_RESULTS_PER_PAGE
-                            )
-                            .execute()
-                        )
-                        break
-                    except Exception as e:
-                        if retry == MAX_RETRIES - 1:
-                            raise
-                        time.sleep(RETRY_DELAY)
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
 
-                messages = result.get("messages", [])
-                total += len(messages)
+        return message_ids
 
-                page_token = result.get("nextPageToken")
-                if not page_token:
-                    break
+    def _listed_pages(
+        self, service: Any, start_date: datetime, end_date: datetime
+    ) -> Generator[List[str], None, None]:
+        """
+        List message IDs page by page, one page ahead of the caller.
 
-                # Small delay between batches to avoid rate limiting
-                time.sleep(0.1)
+        The next page is requested in the background while the caller works
+        on the current one, hiding the list round trip behind the fetch.
 
-            return total
+        Args:
+            service: Gmail API service instance.
+            start_date: Start date for email range.
+            end_date: End date for email range.
 
-        except Exception as e:
-            self.logger.error(f"Error getting message count: {str(e)}")
-            return 0
+        Yields:
+            List[str]: Message IDs of each page, newest first.
+        """
+        query = self._build_query(start_date, end_date)
+        with ThreadPoolExecutor(max_workers=1) as lister:
+            next_page = lister.submit(self._list_page, service, query)
+            while next_page is not None:
+                result = next_page.result()
+                page_token = result.get("nextPageToken")
+                next_page = (
+                    lister.submit(self._list_page, service, query, page_token)
+                    if page_token else None
+                )
+                yield [message["id"] for message in result.get("messages", [])]
 
     def get_sent_emails_with_progress(
-        self, service, start_date: datetime, end_date: datetime
+        self, service, start_date: datetime, end_date: datetime,
+        message_ids: Optional[List[str]] = None, keep_undated: bool = False,
+        on_listed: Optional[Callable[[int], None]] = None
     ) -> Generator[List[Dict[str, Any]], None, None]:
         """
         Get sent emails with progress reporting.
@@ -333,102 +658,200 @@ class GmailService:
             service: Gmail API service instance.
             start_date: Start date for email range.
             end_date: End date for email range.
+            message_ids: IDs from list_message_ids, if already listed;
+                saves listing the date range a second time. Otherwise each
+                list page is fetched while the next one is being listed.
+            keep_undated: Yield messages without a usable Date header with
+                "No Date" instead of leaving them out.
+            on_listed: Called with the number of messages listed so far
+                each time a page of IDs arrives, so callers can grow their
+                progress total.
 
         Yields:
-            List[Dict[str, Any]]: Batches of email data.
+            List[Dict[str, Any]]: Email data in batches of up to BATCH_SIZE
+            messages; within each list page, messages cached by an earlier
+            run come first.
         """
-        query = f'in:sent after:{start_date.strftime("%Y/%m/%d")} before:{end_date.strftime("%Y/%m/%d")}'
-        page_token = None
-        processed_count = 0
-
-        while True:
-            # Get batch of message IDs with retries
-            for retry in range(MAX_RETRIES):
-                try:
-                    result = (
-                        service.users()
-                        .messages()
-                        .list(
-                            userId="me",
-                            q=query,
-                            pageToken=page_token,
-                            maxResults=MAX_RESULTS_PER_PAGE
-                        )
-                        .execute()
+        if message_ids is None:
+            pages = self._listed_pages(service, start_date, end_date)
+        else:
+            pages = [message_ids]
+
+        # Only messages not seen by an earlier export are fetched
+        account = self._service_emails.get(service) if config.CACHE_MESSAGES else None
+        cache = self._load_message_cache(account) if account else {}
+        columns = ("Date", "Username", "Domain", "Subject")
+        listed = 0
+        fetched_any = False
+
+        # Batches of every page go to one pool as soon as the page is listed,
+        # so fetching never waits for a page boundary; results are yielded
+        # in request order
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            in_flight = deque()
+            for page_ids in pages:
+                listed += len(page_ids)
+                if on_listed is not None:
+                    on_listed(listed)
+
+                cached = [
+                    dict(zip(columns, cache[message_id]))
+                    for message_id in page_ids
+                    if message_id in cache
+                    and (keep_undated or cache[message_id][0] != "No Date")
+                ]
+                for start in range(0, len(cached), BATCH_SIZE):
+                    yield cached[start:start + BATCH_SIZE]
+                page_ids = [
+                    message_id for message_id in page_ids if message_id not in cache
+                ]
+                fetched_any = fetched_any or bool(page_ids)
+                for start in range(0, len(page_ids), BATCH_SIZE):
+                    in_flight.append(executor.submit(
+                        self._fetch_batch, service, page_ids[start:start + BATCH_SIZE]
+                    ))
+
+                # Hand over what is ready; the rest finishes while the next
+                # page is listed
+                while in_flight and in_flight[0].done():
+                    batch_data = self._parse_fetched(
+                        in_flight.popleft().result(), cache, keep_undated
                     )
-                    break
-                except Exception as e:
-                    if retry == MAX_RETRIES - 1:
-                        raise
-                    time.sleep(RETRY_DELAY)
+                    if batch_data:
+                        yield batch_data
 
-            messages = result.get("messages", [])
-            if not messages:
-                break
+            while in_flight:
+                batch_data = self._parse_fetched(
+                    in_flight.popleft().result(), cache, keep_undated
+                )
+                if batch_data:
+                    yield batch_data
 
-            # Process each message in the batch
-            for message in messages:
-                try:
-                    # Get message details with retries
-                    for retry in range(MAX_RETRIES):
-                        try:
-                            msg = (
-                                service.users()
-                                .messages()
-                                .get(userId="me", id=message["id"], format="full")
-                                .execute()
-                            )
-                            break
-                        except Exception as e:
-                            if retry == MAX_RETRIES - 1:
-                                raise
-                            time.sleep(RETRY_DELAY)
+        if account and fetched_any:
+            self._save_message_cache(account, cache)
 
-                    # Extract email data
-                    headers = msg["payload"]["headers"]
-                    to_address = self._get_header(headers, "to", "No Recipient")
-                    username, domain = self._split_email(to_address)
+    def _parse_fetched(
+        self, fetched: List[Tuple[str, Dict]], cache: Dict[str, list],
+        keep_undated: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        Turn one fetched batch into export rows, filling the cache.
 
-                    # Get the date and verify it's within range
-                    date_str = self._get_header(headers, "date", None)
+        Args:
+            fetched: (message id, message) pairs from _fetch_batch.
+            cache: Message cache of the account, updated in place.
+            keep_undated: Keep messages without a usable Date header.
+
+        Returns:
+            List[Dict[str, Any]]: Email data of the batch.
+        """
+        batch_data = []
+        for message_id, msg in fetched:
+            try:
+                # Extract email data
+                headers = self._header_map(msg["payload"]["headers"])
+                to_address = headers.get("to", "No Recipient")
+                username, domain = _split_email(to_address)
+
+                # Get the date and verify it's within range
+                date_str = headers.get("date")
+                formatted_date = _format_date(date_str) if date_str else None
+                subject = headers.get("subject", "No Subject")
+                cache[message_id] = [formatted_date or "No Date", username, domain, subject]
+                if formatted_date is None:
                     if not date_str:
-                        self.logger.error(f"No date found for message {message['id']}")
+                        self.logger.error(f"No date found for message {message_id}")
+                    else:
+                        self.logger.error(f"Error parsing date '{date_str}'")
+                    if not keep_undated:
                         continue
+                    formatted_date = "No Date"
 
-                    try:
-                        # Parse the date immediately
-                        parsed_date = parsedate_to_datetime(date_str)
-                        formatted_date = parsed_date.strftime("%Y-%m-%d %H:%M:%S")
-
-                        email_data = {
-                            "Date": formatted_date,
-                            "Username": username,
-                            "Domain": domain,
-                            "Subject": self._get_header(
-                                headers, "subject", "No Subject"
-                            ),
-                        }
-
-                        processed_count += 1
-                        yield [email_data]
-
-                    except Exception as e:
-                        self.logger.error(f"Error parsing date '{date_str}': {str(e)}")
-                        continue
+                batch_data.append({
+                    "Date": formatted_date,
+                    "Username": username,
+                    "Domain": domain,
+                    "Subject": subject,
+                })
 
-                except Exception as e:
-                    self.logger.error(
-                        f"Error processing message {message['id']}: {str(e)}"
-                    )
-                    continue
+            except Exception as e:
+                self.logger.error(
+                    f"Error processing message {message_id}: {str(e)}"
+                )
+                continue
 
-            # Get the next page token
-            page_token = result.get("nextPageToken")
-            if not page_token:
-                break
+        return batch_data
+
+    def fetch_all_accounts(
+        self, emails: List[str], start_date: datetime, end_date: datetime,
+        on_progress: Optional[Callable[[str, int, int], None]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch sent emails for several OAuth accounts in parallel.
+
+        Gmail's quota is per user, so accounts do not slow each other down.
+        Services are set up one at a time first, so at most one browser
+        sign-in is ever open. Accounts with the most messages start first.
+
+        Args:
+            emails: OAuth account email addresses.
+            start_date: Start date for email range.
+            end_date: End date for email range.
+            on_progress: Called with (email, emails fetched, messages listed)
+                once an account is listed and after each of its batches;
+                called from worker threads while fetching.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Email data by account. Accounts
+            that failed are logged and left out.
+        """
+        services = {}
+        for email in emails:
+            try:
+                services[email] = self.setup_service(email)
+            except Exception as e:
+                self.logger.error(f"Error setting up {email}: {str(e)}")
+        if not services:
+            return {}
 
-            # Small delay between batches to avoid rate limiting
-            time.sleep(0.1)
+        def fetch(email, message_ids):
+            emails_data = []
+            for batch in self.get_sent_emails_with_progress(
+                services[email], start_date, end_date, message_ids=message_ids
+            ):
+                emails_data.extend(batch)
+                if on_progress is not None:
+                    on_progress(email, len(emails_data), len(message_ids))
+            return emails_data
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(ACCOUNT_WORKERS, len(services))) as executor:
+            list_futures = {
+                email: executor.submit(self.list_message_ids, service, start_date, end_date)
+                for email, service in services.items()
+            }
+            listed = []
+            for email, future in list_futures.items():
+                try:
+                    listed.append((email, future.result()))
+                except Exception as e:
+                    self.logger.error(f"Error listing messages for {email}: {str(e)}")
+
+            # Largest accounts first so they do not become the stragglers
+            listed.sort(key=lambda item: len(item[1]), reverse=True)
+            if on_progress is not None:
+                for email, message_ids in listed:
+                    on_progress(email, 0, len(message_ids))
+            fetch_futures = {
+                email: executor.submit(fetch, email, message_ids)
+                for email, message_ids in listed
+            }
+            for email, future in fetch_futures.items():
+                try:
+                    results[email] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error fetching emails for {email}: {str(e)}")
+        return results
 
     def _get_body_from_parts(self, parts: List[Dict[str, Any]]) -> str:
         """
@@ -441,15 +864,18 @@ class GmailService:
             str: Email body text.
         """
         text = []
-        for part in parts:
+        # Walk the MIME tree depth-first in document order without recursing
+        stack = list(reversed(parts))
+        while stack:
+            part = stack.pop()
             if part.get("mimeType") == "text/plain":
                 text.append(
-                    base64.urlsafe_b64decode(
-                        part["body"].get("data", "").encode("utf-8")
-                    ).decode("utf-8")
+                    base64.urlsafe_b64decode(part["body"].get("data", "")).decode(
+                        "utf-8", errors="replace"
+                    )
                 )
             elif "parts" in part:
-                text.append(self._get_body_from_parts(part["parts"]))
+                stack.extend(reversed(part["parts"]))
         return "\n".join(text)
 
     def setup_imap_service(self, email: str, app_password: str):
@@ -496,58 +922,59 @@ class GmailService:
             before_date = end_date.strftime("%d-%b-%Y")
             search_criteria = f'(SINCE "{since_date}" BEFORE "{before_date}")'
             
-            # Search for emails
-            _, message_numbers = imap.search(None, search_criteria)
+            # Search by UID so matches can be fetched in a few range commands
+            _, data = imap.uid("SEARCH", None, search_criteria)
+            uids = [uid.decode() for uid in data[0].split()]
             
             emails_data = []
-            total_messages = len(message_numbers[0].split())
+            # Only headers are fetched, so no MIME body tree is needed
+            parser = BytesHeaderParser()
             
-            with tqdm(total=total_messages, desc="Fetching emails") as pbar:
-                for num in message_numbers[0].split():
-                    try:
-                        # Fetch email message
-                        _, msg_data = imap.fetch(num, "(RFC822)")
-                        email_body = msg_data[0][1]
-                        msg = email.message_from_bytes(email_body)
-                        
-                        # Get recipient
-                        to_address = msg["to"] or "No Recipient"
-                        username, domain = self._split_email(to_address)
-                        
-                        # Get date
-                        date_str = msg["date"]
-                        if date_str:
-                            try:
-                                parsed_date = parsedate_to_datetime(date_str)
-                                formatted_date = parsed_date.strftime("%Y-%m-%d %H:%M:%S")
-                            except Exception:
-                                formatted_date = "No Date"
-                        else:
-                            formatted_date = "No Date"
-                        
-                        # Get subject
-                        subject = msg["subject"]
-                        if subject:
-                            # Decode subject if needed
-                            decoded_subject = decode_header(subject)[0]
-                            if isinstance(decoded_subject[0], bytes):
-                                subject = decoded_subject[0].decode(decoded_subject[1] or "utf-8")
-                        else:
-                            subject = "No Subject"
-                        
-                        email_data = {
-                            "Date": formatted_date,
-                            "Username": username,
-                            "Domain": domain,
-                            "Subject": subject,
-                        }
-                        
-                        emails_data.append(email_data)
-                        pbar.update(1)
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error processing message: {str(e)}")
-                        continue
+            with tqdm(total=len(uids), desc="Fetching emails", mininterval=0.5) as pbar:
+                for start in range(0, len(uids), IMAP_FETCH_CHUNK):
+                    chunk = uids[start:start + IMAP_FETCH_CHUNK]
+                    # One round trip for the headers of the whole chunk
+                    _, msg_data = imap.uid("FETCH", ",".join(chunk), IMAP_HEADER_FETCH)
+                    
+                    # Header blobs come as (envelope, data) tuples between
+                    # closing b")" lines
+                    for item in msg_data:
+                        if not isinstance(item, tuple):
+                            continue
+                        try:
+                            msg = parser.parsebytes(item[1])
+                            
+                            # Get recipient
+                            to_address = msg["to"] or "No Recipient"
+                            username, domain = _split_email(to_address)
+                            
+                            # Get date
+                            date_str = msg["date"]
+                            formatted_date = _format_date(date_str) or "No Date"
+                            
+                            # Get subject
+                            subject = msg["subject"]
+                            if subject:
+                                # Decode subject if needed
+                                decoded_subject = decode_header(subject)[0]
+                                if isinstance(decoded_subject[0], bytes):
+                                    subject = decoded_subject[0].decode(decoded_subject[1] or "utf-8")
+                            else:
+                                subject = "No Subject"
+                            
+                            email_data = {
+                                "Date": formatted_date,
+                                "Username": username,
+                                "Domain": domain,
+                                "Subject": subject,
+                            }
+                            
+                            emails_data.append(email_data)
+                            
+                        except Exception as e:
+                            self.logger.error(f"Error processing message: {str(e)}")
+                            continue
+                    pbar.update(len(chunk))
             
             return emails_data
             
@@ -1,5 +1,7 @@
+import logging
 import sys
-from datetime import datetime, date
+import time
+from datetime import date, timedelta
 import threading
 from PyQt6.QtWidgets import (
     QApplication,
@@ -20,153 +22,143 @@ from PyQt6.QtWidgets import (
     QCheckBox,
     QListWidgetItem,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QDate
+from PyQt6.QtCore import (
+    Qt, QThreadPool, QRunnable, QObject, QElapsedTimer, pyqtSignal, QDate
+)
 from PyQt6.QtGui import QFont
-from calendar import monthrange
-from tqdm import tqdm
 
 from src.main import GmailExportTool
+from src import config, profiling
 
 
-class CustomTqdm:
-    def __init__(self, total, desc, callback):
-        self.total = total
-        self.n = 0
-        self.desc = desc
-        self.callback = callback
-        if self.callback:
-            self.callback(0, self.total)  # Initial progress
-
-    def update(self, n):
-        self.n += n
-        if self.callback:
-            self.callback(self.n, self.total)
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        pass  # Cleanup if needed
-
-    def close(self):
-        pass
-
-    def clear(self):
-        pass
-
-    def refresh(self):
-        pass
+# Browser sign-ins and token refreshes are done one account at a time
+_SERVICE_SETUP_LOCK = threading.Lock()
 
-    def write(self, s):
-        pass
+# Minimum time between progress bar redraws during an export
+PROGRESS_INTERVAL_MS = 50
+# Minimum time in seconds between progress reports from an export job
+PROGRESS_EMIT_INTERVAL = 0.1
 
-    @property
-    def format_dict(self):
-        return {"n": self.n, "total": self.total}
 
+class EmailExportSignals(QObject):
+    finished = pyqtSignal(str, bool, str)  # email, success, message
+    progress = pyqtSignal(str, str)  # email, message
+    progress_update = pyqtSignal(str, int, int, bool)  # email, current, total, done
 
-class EmailExportWorker(QThread):
-    finished = pyqtSignal(bool, str)
-    progress = pyqtSignal(str)
-    progress_update = pyqtSignal(int, int)  # current, total
 
+class EmailExportRunnable(QRunnable):
     def __init__(self, gmail_tool, email, start_date, end_date):
         super().__init__()
         self.gmail_tool = gmail_tool
         self.email = email
         self.start_date = start_date
         self.end_date = end_date
+        self.signals = EmailExportSignals()
 
     def run(self):
         try:
-            service = self.gmail_tool.gmail_service.setup_service(self.email)
-            if not service:
-                self.finished.emit(False, "Failed to authenticate with Gmail")
-                return
-
-            self.progress.emit("Fetching emails...")
-            
-            # Store original tqdm
-            original_tqdm = tqdm
-            
-            # Create our tqdm replacement
-            def custom_tqdm(*args, **kwargs):
-                return CustomTqdm(
-                    total=kwargs.get('total', args[0] if args else None),
-                    desc=kwargs.get('desc', ''),
-                    callback=self.progress_update.emit
+            # Inside the try so a profiler error still reports back to the GUI
+            with profiling.profiled("export"):
+                gmail_service = self.gmail_tool.gmail_service
+                with _SERVICE_SETUP_LOCK:
+                    service = gmail_service.setup_service(self.email)
+                if not service:
+                    self.signals.finished.emit(self.email, False, "Failed to authenticate with Gmail")
+                    return
+
+                self.signals.progress.emit(self.email, "Fetching emails...")
+                emails_data = []
+                total = 0
+
+                def on_listed(count):
+                    # Listing and fetching overlap; the total grows per page
+                    nonlocal total
+                    total = count
+
+                # Coalesce updates before they cross to the GUI thread; cached
+                # batches arrive much faster than the bar needs redrawing
+                last_emit = time.monotonic()
+                # Undated messages are exported with "No Date", as they always
+                # were in the GUI
+                for email_batch in gmail_service.get_sent_emails_with_progress(
+                    service, self.start_date, self.end_date,
+                    keep_undated=True, on_listed=on_listed,
+                ):
+                    emails_data.extend(email_batch)
+                    now = time.monotonic()
+                    if now - last_emit >= PROGRESS_EMIT_INTERVAL:
+                        self.signals.progress_update.emit(self.email, len(emails_data), total, False)
+                        last_emit = now
+                # Skipped messages can leave the count short of total, so the
+                # last update is flagged for the GUI to draw it unthrottled
+                self.signals.progress_update.emit(self.email, len(emails_data), total, True)
+
+                if not emails_data:
+                    self.signals.finished.emit(
+                        self.email, False, "No emails found in the specified date range"
+                    )
+                    return
+
+                self.signals.progress.emit(self.email, "Exporting to Excel...")
+                output_file = self.gmail_tool.file_manager.get_export_path(
+                    self.email, self.start_date, self.end_date
                 )
-            
-            # Replace tqdm globally
-            tqdm.__init__ = custom_tqdm
-            tqdm.__call__ = custom_tqdm
-            tqdm.__new__ = lambda cls, *args, **kwargs: custom_tqdm(*args, **kwargs)
-            
-            try:
-                emails_data = self.gmail_tool.gmail_service.get_sent_emails(
-                    service, 
-                    self.start_date, 
-                    self.end_date
-                )
-            finally:
-                # Restore original tqdm
-                tqdm.__init__ = original_tqdm.__init__
-                tqdm.__call__ = original_tqdm.__call__
-                tqdm.__new__ = original_tqdm.__new__
-
-            if not emails_data:
-                self.finished.emit(False, "No emails found in the specified date range")
-                return
-
-            self.progress.emit("Exporting to Excel...")
-            output_file = self.gmail_tool.file_manager.get_export_path(
-                self.email, self.start_date
-            )
-            if self.gmail_tool.export_manager.export_to_excel(
-                emails_data, output_file, self.email
-            ):
-                self.finished.emit(
-                    True,
-                    f"Successfully exported {len(emails_data)} emails to:\n{output_file}",
-                )
-            else:
-                self.finished.emit(False, "Failed to export emails to Excel")
+                # Written in a separate process so parallel exports do not
+                # contend for the GIL
+                if self.gmail_tool.export_manager.export_in_process(
+                    emails_data, output_file, self.email
+                ):
+                    # Very large exports are split into several part files
+                    files = self.gmail_tool.export_manager.output_files(
+                        output_file, len(emails_data)
+                    )
+                    self.signals.finished.emit(
+                        self.email,
+                        True,
+                        f"Successfully exported {len(emails_data)} emails to:\n" + "\n".join(files),
+                    )
+                else:
+                    self.signals.finished.emit(self.email, False, "Failed to export emails to Excel")
         except Exception as e:
-            self.finished.emit(False, str(e))
+            self.signals.finished.emit(self.email, False, str(e))
 
 
-class AddAccountWorker(QThread):
+class AddAccountSignals(QObject):
     finished = pyqtSignal(bool, str)
     progress = pyqtSignal(str)
 
+
+class AddAccountRunnable(QRunnable):
     def __init__(self, gmail_tool, email):
         super().__init__()
         self.gmail_tool = gmail_tool
         self.email = email
+        self.signals = AddAccountSignals()
 
     def run(self):
         try:
-            self.progress.emit("Adding account...")
+            self.signals.progress.emit("Adding account...")
             if not self.gmail_tool.account_manager.add_account(self.email):
-                self.finished.emit(False, "Failed to add account")
+                self.signals.finished.emit(False, "Failed to add account")
                 return
 
-            self.progress.emit("Authenticating with Gmail...")
+            self.signals.progress.emit("Authenticating with Gmail...")
             # Test authentication immediately
-            service = self.gmail_tool.gmail_service.setup_service(self.email)
+            with _SERVICE_SETUP_LOCK:
+                service = self.gmail_tool.gmail_service.setup_service(self.email)
             if service:
-                self.finished.emit(True, "Account added and authenticated successfully")
+                self.signals.finished.emit(True, "Account added and authenticated successfully")
             else:
                 # If authentication fails, remove the account
                 self.gmail_tool.account_manager.remove_account(self.email)
-                self.finished.emit(False, "Failed to authenticate with Gmail")
+                self.signals.finished.emit(False, "Failed to authenticate with Gmail")
         except Exception as e:
             # If any error occurs, ensure the account is removed
             try:
                 self.gmail_tool.account_manager.remove_account(self.email)
             except:
                 pass
-            self.finished.emit(False, str(e))
+            self.signals.finished.emit(False, str(e))
 
 
 class CalendarDialog(QDialog):
@@ -179,63 +171,17 @@ class CalendarDialog(QDialog):
 
         # Calendar widget
         self.calendar = QCalendarWidget()
-        self.calendar.setStyleSheet(
-            """
-            QCalendarWidget {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QCalendarWidget QToolButton {
-                color: white;
-                background-color: #2b2b2b;
-            }
-            QCalendarWidget QMenu {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QCalendarWidget QTableView {
-                background-color: #2b2b2b;
-                selection-background-color: #0078d4;
-            }
-        """
-        )
         layout.addWidget(self.calendar)
 
         # Buttons
         button_layout = QHBoxLayout()
 
         ok_button = QPushButton("OK")
-        ok_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #1084d8;
-            }
-        """
-        )
+        ok_button.setObjectName("primary")
         ok_button.clicked.connect(self.accept)
 
         cancel_button = QPushButton("Cancel")
-        cancel_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #333333;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #404040;
-            }
-        """
-        )
+        cancel_button.setObjectName("secondary")
         cancel_button.clicked.connect(self.reject)
 
         button_layout.addWidget(ok_button)
@@ -248,67 +194,6 @@ class CalendarDialog(QDialog):
         return self.calendar.selectedDate()
 
 
-class AccountListItem(QWidget):
-    def __init__(self, email, parent=None):
-        super().__init__(parent)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(10)
-        
-        # Create a container for checkbox to control its size
-        checkbox_container = QWidget()
-        checkbox_container.setFixedWidth(24)  # Reduced width
-        checkbox_layout = QHBoxLayout(checkbox_container)
-        checkbox_layout.setContentsMargins(0, 0, 0, 0)
-        checkbox_layout.setSpacing(0)
-        
-        self.checkbox = QCheckBox()
-        self.checkbox.setStyleSheet("""
-            QCheckBox {
-                spacing: 0px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 1px solid #3f3f3f;
-                background: #2b2b2b;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                border: 1px solid #0078d4;
-                background: #0078d4;
-                border-radius: 3px;
-                image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='12' height='12' viewBox='0 0 24 24' fill='none' stroke='white' stroke-width='3' stroke-linecap='round' stroke-linejoin='round'%3E%3Cpolyline points='20 6 9 17 4 12'%3E%3C/polyline%3E%3C/svg%3E");
-            }
-            QCheckBox::indicator:hover {
-                border-color: #0078d4;
-            }
-        """)
-        checkbox_layout.addWidget(self.checkbox, 0, Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(checkbox_container)
-        
-        self.email_label = QLabel(email)
-        self.email_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 12px;
-                padding: 2px;
-            }
-        """)
-        layout.addWidget(self.email_label, stretch=1)
-
-    def is_checked(self):
-        return self.checkbox.isChecked()
-
-    def get_email(self):
-        return self.email_label.text()
-
-    def set_checked(self, checked):
-        self.checkbox.setChecked(checked)
-
-
 class GmailExportGUI(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -319,6 +204,14 @@ class GmailExportGUI(QMainWindow):
         self.setWindowTitle("Gmail Export Tool")
         self.setFixedSize(800, 500)
 
+        # Fonts need a running QApplication, so they are built here once
+        # rather than at import time
+        self.title_font = QFont("Arial", 14, QFont.Weight.Bold)
+
+        # Throttles progress bar redraws, see update_progress
+        self.progress_timer = QElapsedTimer()
+        self.last_percentage = None
+
         # Create central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -402,23 +295,17 @@ class GmailExportGUI(QMainWindow):
         
         main_layout.addWidget(footer)
 
+        # Buttons disabled while an account is being added; collected once
+        # here, since the widget tree does not change after this point
+        self.toggleable_buttons = self.findChildren(QPushButton)
+
         # Refresh account list
         self.refresh_account_list()
 
     def get_last_month_range(self):
-        today = date.today()
-        
-        # If we're in month M, we want month M-1
-        if today.month == 1:  # If January, go to previous year's December
-            start_date = date(today.year - 1, 12, 1)
-            _, last_day = monthrange(today.year - 1, 12)
-            end_date = date(today.year - 1, 12, last_day)
-        else:
-            start_date = date(today.year, today.month - 1, 1)
-            _, last_day = monthrange(today.year, today.month - 1)
-            end_date = date(today.year, today.month - 1, last_day)
-        
-        return start_date, end_date
+        # The day before the 1st of this month is the last day of last month
+        end_date = date.today().replace(day=1) - timedelta(days=1)
+        return end_date.replace(day=1), end_date
 
     def create_sidebar(self):
         sidebar = QFrame()
@@ -427,7 +314,7 @@ class GmailExportGUI(QMainWindow):
 
         # Title
         title = QLabel("Gmail Export Tool")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        title.setFont(self.title_font)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
@@ -441,30 +328,7 @@ class GmailExportGUI(QMainWindow):
         header_layout.addWidget(accounts_label)
         
         self.select_all_checkbox = QCheckBox("Select All")
-        self.select_all_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #cccccc;
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 1px solid #3f3f3f;
-                background: #2b2b2b;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                border: 1px solid #0078d4;
-                background: #0078d4;
-                border-radius: 3px;
-                image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='12' height='12' viewBox='0 0 24 24' fill='none' stroke='white' stroke-width='3' stroke-linecap='round' stroke-linejoin='round'%3E%3Cpolyline points='20 6 9 17 4 12'%3E%3C/polyline%3E%3C/svg%3E");
-            }
-            QCheckBox::indicator:hover {
-                border-color: #0078d4;
-            }
-        """)
+        self.select_all_checkbox.setObjectName("selectAll")
         self.select_all_checkbox.clicked.connect(self.toggle_all_accounts)
         header_layout.addWidget(self.select_all_checkbox, alignment=Qt.AlignmentFlag.AlignRight)
         
@@ -476,11 +340,12 @@ class GmailExportGUI(QMainWindow):
             QListWidget {
                 background-color: #2b2b2b;
                 color: white;
+                font-size: 12px;
                 border: 1px solid #3f3f3f;
                 border-radius: 4px;
             }
             QListWidget::item {
-                padding: 0px;
+                padding: 8px;
                 border-bottom: 1px solid #3f3f3f;
             }
             QListWidget::item:selected {
@@ -495,27 +360,7 @@ class GmailExportGUI(QMainWindow):
 
         # Remove account button
         remove_button = QPushButton("Remove Account")
-        remove_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #d42828;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                margin-top: 5px;
-            }
-            QPushButton:hover {
-                background-color: #e13131;
-            }
-            QPushButton:pressed {
-                background-color: #c42424;
-            }
-            QPushButton:disabled {
-                background-color: #666666;
-            }
-        """
-        )
+        remove_button.setObjectName("danger")
         remove_button.clicked.connect(self.remove_account)
         layout.addWidget(remove_button)
 
@@ -538,23 +383,7 @@ class GmailExportGUI(QMainWindow):
 
         # Add account button
         add_button = QPushButton("Add Account")
-        add_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #1084d8;
-            }
-            QPushButton:pressed {
-                background-color: #006cbd;
-            }
-        """
-        )
+        add_button.setObjectName("primary")
         add_button.clicked.connect(self.add_account)
         layout.addWidget(add_button)
 
@@ -568,7 +397,7 @@ class GmailExportGUI(QMainWindow):
 
         # Title
         title = QLabel("Export Settings")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        title.setFont(self.title_font)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
@@ -583,24 +412,9 @@ class GmailExportGUI(QMainWindow):
         start_date_layout = QVBoxLayout()
         start_date_label = QLabel("Start Date:")
         self.start_date_button = QPushButton("Select Start Date")
-        self.start_date_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #2b2b2b;
-                color: white;
-                border: 1px solid #3f3f3f;
-                border-radius: 4px;
-                padding: 8px;
-                min-width: 150px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #363636;
-            }
-        """
-        )
+        self.start_date_button.setObjectName("date")
         self.start_date = QDate(default_start_date.year, default_start_date.month, default_start_date.day)
-        self.start_date_button.setText(self.start_date.toString("yyyy-MM-dd"))
+        self.start_date_button.setText(self.start_date.toString(Qt.DateFormat.ISODate))
         self.start_date_button.clicked.connect(self.show_start_date_dialog)
 
         start_date_layout.addWidget(start_date_label)
@@ -614,24 +428,9 @@ class GmailExportGUI(QMainWindow):
         end_date_layout = QVBoxLayout()
         end_date_label = QLabel("End Date:")
         self.end_date_button = QPushButton("Select End Date")
-        self.end_date_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #2b2b2b;
-                color: white;
-                border: 1px solid #3f3f3f;
-                border-radius: 4px;
-                padding: 8px;
-                min-width: 150px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #363636;
-            }
-        """
-        )
+        self.end_date_button.setObjectName("date")
         self.end_date = QDate(default_end_date.year, default_end_date.month, default_end_date.day)
-        self.end_date_button.setText(self.end_date.toString("yyyy-MM-dd"))
+        self.end_date_button.setText(self.end_date.toString(Qt.DateFormat.ISODate))
         self.end_date_button.clicked.connect(self.show_end_date_dialog)
 
         end_date_layout.addWidget(end_date_label)
@@ -647,28 +446,7 @@ class GmailExportGUI(QMainWindow):
 
         # Export button
         self.export_button = QPushButton("Export Emails")
-        self.export_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 4px;
-                font-weight: bold;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background-color: #1084d8;
-            }
-            QPushButton:pressed {
-                background-color: #006cbd;
-            }
-            QPushButton:disabled {
-                background-color: #666666;
-            }
-        """
-        )
+        self.export_button.setObjectName("export")
         self.export_button.clicked.connect(self.export_emails)
 
         # Center the export button
@@ -682,28 +460,26 @@ class GmailExportGUI(QMainWindow):
         return content
 
     def refresh_account_list(self):
+        # Plain checkable items are painted by the view itself; no widget
+        # tree is built per account
         self.account_list.clear()
         accounts = self.gmail_tool.account_manager.list_accounts()
         for email in accounts:
-            item = QListWidgetItem(self.account_list)
-            account_widget = AccountListItem(email)
-            item.setSizeHint(account_widget.sizeHint())
-            self.account_list.addItem(item)
-            self.account_list.setItemWidget(item, account_widget)
+            item = QListWidgetItem(email, self.account_list)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Unchecked)
 
     def toggle_all_accounts(self, checked):
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
         for i in range(self.account_list.count()):
-            item = self.account_list.item(i)
-            widget = self.account_list.itemWidget(item)
-            widget.set_checked(checked)
+            self.account_list.item(i).setCheckState(state)
 
     def get_selected_accounts(self):
         selected = []
         for i in range(self.account_list.count()):
             item = self.account_list.item(i)
-            widget = self.account_list.itemWidget(item)
-            if widget.is_checked():
-                selected.append(widget.get_email())
+            if item.checkState() == Qt.CheckState.Checked:
+                selected.append(item.text())
         return selected
 
     def add_account(self):
@@ -715,19 +491,22 @@ class GmailExportGUI(QMainWindow):
         # Disable the input and buttons during the process
         self.email_input.setEnabled(False)
         self.export_button.setEnabled(False)
-        for button in self.findChildren(QPushButton):
+        for button in self.toggleable_buttons:
             button.setEnabled(False)
 
-        self.worker = AddAccountWorker(self.gmail_tool, email)
-        self.worker.progress.connect(lambda msg: self.status_bar.showMessage(msg))
-        self.worker.finished.connect(self.on_add_account_finished)
-        self.worker.start()
+        # Runs on the shared pool; the job is kept so its signals stay alive
+        self.add_account_job = AddAccountRunnable(self.gmail_tool, email)
+        self.add_account_job.signals.progress.connect(
+            lambda msg: self.status_bar.showMessage(msg)
+        )
+        self.add_account_job.signals.finished.connect(self.on_add_account_finished)
+        QThreadPool.globalInstance().start(self.add_account_job)
 
     def on_add_account_finished(self, success, message):
         # Re-enable the input and buttons
         self.email_input.setEnabled(True)
         self.export_button.setEnabled(True)
-        for button in self.findChildren(QPushButton):
+        for button in self.toggleable_buttons:
             button.setEnabled(True)
 
         if success:
@@ -744,14 +523,14 @@ class GmailExportGUI(QMainWindow):
         dialog.calendar.setSelectedDate(self.start_date)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.start_date = dialog.get_selected_date()
-            self.start_date_button.setText(self.start_date.toString("yyyy-MM-dd"))
+            self.start_date_button.setText(self.start_date.toString(Qt.DateFormat.ISODate))
 
     def show_end_date_dialog(self):
         dialog = CalendarDialog(self, "Select End Date")
         dialog.calendar.setSelectedDate(self.end_date)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.end_date = dialog.get_selected_date()
-            self.end_date_button.setText(self.end_date.toString("yyyy-MM-dd"))
+            self.end_date_button.setText(self.end_date.toString(Qt.DateFormat.ISODate))
 
     def export_emails(self):
         selected_accounts = self.get_selected_accounts()
@@ -769,37 +548,28 @@ class GmailExportGUI(QMainWindow):
         self.export_button.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
-        
-        # Start with the first account
-        self.current_account_index = 0
-        self.selected_accounts = selected_accounts
-        self.start_next_export()
-
-    def start_next_export(self):
-        if self.current_account_index >= len(self.selected_accounts):
-            self.export_button.setEnabled(True)
-            self.progress_bar.hide()
-            self.progress_label.setText("")
-            self.status_bar.showMessage("")
-            QMessageBox.information(self, "Success", "All exports completed successfully!")
-            return
-
-        email = self.selected_accounts[self.current_account_index]
-        self.status_bar.showMessage(f"Processing account: {email}")
-        
-        self.worker = EmailExportWorker(
-            self.gmail_tool, 
-            email, 
-            self.start_date.toPyDate(), 
-            self.end_date.toPyDate()
-        )
-        self.worker.progress.connect(lambda msg: self.status_bar.showMessage(f"{email}: {msg}"))
-        self.worker.progress_update.connect(self.update_progress)
-        self.worker.finished.connect(self.on_single_export_finished)
-        self.worker.start()
+        self.status_bar.showMessage(f"Exporting {len(selected_accounts)} account(s)...")
+
+        # Accounts are independent, so they are exported side by side on the
+        # global thread pool; its size bounds how many run at once
+        self.exports_pending = len(selected_accounts)
+        self.export_progress = {}
+        self.progress_timer.invalidate()
+        self.last_percentage = None
+        self.export_jobs = []
+        pool = QThreadPool.globalInstance()
+        for email in selected_accounts:
+            job = EmailExportRunnable(self.gmail_tool, email, start_date, end_date)
+            job.signals.progress.connect(
+                lambda email, msg: self.status_bar.showMessage(f"{email}: {msg}")
+            )
+            job.signals.progress_update.connect(self.update_progress)
+            job.signals.finished.connect(self.on_single_export_finished)
+            self.export_jobs.append(job)
+            pool.start(job)
 
-    def on_single_export_finished(self, success, message):
-        email = self.selected_accounts[self.current_account_index]
+    def on_single_export_finished(self, email, success, message):
+        # Signals are delivered on the GUI thread, so no locking is needed
         if success:
             self.status_bar.showMessage(f"Export completed for {email}")
         else:
@@ -808,18 +578,41 @@ class GmailExportGUI(QMainWindow):
                 "Warning", 
                 f"Failed to export emails for {email}:\n{message}"
             )
-        
-        # Move to next account
-        self.current_account_index += 1
-        self.start_next_export()
 
-    def update_progress(self, current, total):
+        self.exports_pending -= 1
+        if self.exports_pending == 0:
+            self.export_jobs = []
+            self.export_button.setEnabled(True)
+            self.progress_bar.hide()
+            self.progress_label.setText("")
+            self.status_bar.showMessage("")
+            QMessageBox.information(self, "Success", "All exports completed successfully!")
+
+    def update_progress(self, email, current, total, done):
+        # Show the combined progress of all accounts being exported
+        self.export_progress[email] = (current, total)
+        current = sum(fetched for fetched, _ in self.export_progress.values())
+        total = sum(count for _, count in self.export_progress.values())
+
+        # Redraw at most every PROGRESS_INTERVAL_MS; the final count of each
+        # account always shows
+        if (
+            not done
+            and current < total
+            and self.progress_timer.isValid()
+            and self.progress_timer.elapsed() < PROGRESS_INTERVAL_MS
+        ):
+            return
+        self.progress_timer.start()
+
         if total > 0:
             self.progress_bar.setVisible(True)
             percentage = int((current / total) * 100)
-            self.progress_bar.setValue(percentage)
+            if percentage != self.last_percentage:
+                self.last_percentage = percentage
+                self.progress_bar.setValue(percentage)
+                self.progress_bar.setFormat(f"{percentage}%")
             self.progress_label.setText(f"Processing: {current}/{total} emails")
-            self.progress_bar.setFormat(f"{percentage}%")
 
     def remove_account(self):
         selected_accounts = self.get_selected_accounts()
@@ -848,10 +641,12 @@ class GmailExportGUI(QMainWindow):
 
 
 def main():
+    logging.basicConfig(level=config.LOG_LEVEL, format=config.LOG_FORMAT)
     app = QApplication(sys.argv)
     app.setStyle("Fusion")  # Use Fusion style for a modern look
 
-    # Set dark theme
+    # Set dark theme; styles shared by several widgets live here too and are
+    # picked by object name, so Qt parses them once for the whole app
     app.setStyleSheet(
         """
         QMainWindow, QWidget {
@@ -865,6 +660,107 @@ def main():
         QLabel {
             border: none;
         }
+        QCalendarWidget {
+            background-color: #2b2b2b;
+            color: white;
+        }
+        QCalendarWidget QToolButton {
+            color: white;
+            background-color: #2b2b2b;
+        }
+        QCalendarWidget QMenu {
+            background-color: #2b2b2b;
+            color: white;
+        }
+        QCalendarWidget QTableView {
+            background-color: #2b2b2b;
+            selection-background-color: #0078d4;
+        }
+        QCheckBox#selectAll {
+            color: #cccccc;
+            spacing: 5px;
+        }
+        QCheckBox::indicator, QListWidget::indicator {
+            width: 16px;
+            height: 16px;
+        }
+        QCheckBox::indicator:unchecked, QListWidget::indicator:unchecked {
+            border: 1px solid #3f3f3f;
+            background: #2b2b2b;
+            border-radius: 3px;
+        }
+        QCheckBox::indicator:checked, QListWidget::indicator:checked {
+            border: 1px solid #0078d4;
+            background: #0078d4;
+            border-radius: 3px;
+            image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='12' height='12' viewBox='0 0 24 24' fill='none' stroke='white' stroke-width='3' stroke-linecap='round' stroke-linejoin='round'%3E%3Cpolyline points='20 6 9 17 4 12'%3E%3C/polyline%3E%3C/svg%3E");
+        }
+        QCheckBox::indicator:hover, QListWidget::indicator:hover {
+            border-color: #0078d4;
+        }
+        QPushButton#primary, QPushButton#export {
+            background-color: #0078d4;
+            color: white;
+            border: none;
+            padding: 8px;
+            border-radius: 4px;
+        }
+        QPushButton#primary:hover, QPushButton#export:hover {
+            background-color: #1084d8;
+        }
+        QPushButton#primary:pressed, QPushButton#export:pressed {
+            background-color: #006cbd;
+        }
+        QPushButton#export {
+            padding: 10px;
+            font-weight: bold;
+            min-width: 200px;
+        }
+        QPushButton#export:disabled {
+            background-color: #666666;
+        }
+        QPushButton#secondary {
+            background-color: #333333;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+        }
+        QPushButton#secondary:hover {
+            background-color: #404040;
+        }
+        QDialog QPushButton#primary {
+            padding: 8px 16px;
+        }
+        QPushButton#danger {
+            background-color: #d42828;
+            color: white;
+            border: none;
+            padding: 8px;
+            border-radius: 4px;
+            margin-top: 5px;
+        }
+        QPushButton#danger:hover {
+            background-color: #e13131;
+        }
+        QPushButton#danger:pressed {
+            background-color: #c42424;
+        }
+        QPushButton#danger:disabled {
+            background-color: #666666;
+        }
+        QPushButton#date {
+            background-color: #2b2b2b;
+            color: white;
+            border: 1px solid #3f3f3f;
+            border-radius: 4px;
+            padding: 8px;
+            min-width: 150px;
+            text-align: left;
+        }
+        QPushButton#date:hover {
+            background-color: #363636;
+        }
     """
     )
 
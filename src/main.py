@@ -3,7 +3,8 @@ Main entry point for the Gmail Export Tool.
 """
 
 import logging
-from typing import Optional, Tuple
+import threading
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from src.file_manager import FileManager
@@ -11,10 +12,7 @@ from src.account_manager import GmailAccountManager
 from src.gmail_service import GmailService
 from src.export import ExportManager
 from src.cli import EnhancedCLI
-
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+from src import config
 
 
 class GmailExportTool:
@@ -28,6 +26,14 @@ class GmailExportTool:
         self.gmail_service = GmailService(self.file_manager, self.account_manager)
         self.export_manager = ExportManager()
         self.ui = EnhancedCLI()
+        self._dispatch = {
+            1: self._handle_add_account,
+            2: self._handle_remove_account,
+            3: self._handle_export_single,
+            4: self._handle_export_all,
+            5: self._handle_configure_dates,
+            6: self._handle_exit,
+        }
 
     def export_single_account(self, email: str, start_date: datetime, end_date: datetime) -> bool:
         """Export emails from a single account."""
@@ -49,26 +55,22 @@ class GmailExportTool:
                 # Get emails using OAuth
                 self.ui.display_success(f"Starting email fetch for {email}...")
                 emails_data = []
-                
-                # Get total count first
-                total_messages = self.gmail_service.get_total_messages(
-                    service, start_date, end_date
-                )
-                
-                if total_messages == 0:
-                    self.ui.display_error(f"No emails found for {email} in the specified date range")
-                    return False
 
-                # Create progress bar
+                # Create progress bar; listing and fetching overlap, so the
+                # total grows as pages of message IDs arrive
                 with self.ui.display_progress(
-                    total=total_messages,
+                    total=0,
                     desc=f"Fetching emails from {email}"
                 ) as pbar:
+                    def on_listed(count):
+                        pbar.total = count
+                        pbar.refresh()
+
                     for email_batch in self.gmail_service.get_sent_emails_with_progress(
-                        service, start_date, end_date
+                        service, start_date, end_date, on_listed=on_listed
                     ):
                         emails_data.extend(email_batch)
-                        pbar.update(1)
+                        pbar.update(len(email_batch))
             else:  # IMAP
                 app_password = account.get("app_password")
                 if not app_password:
@@ -92,7 +94,9 @@ class GmailExportTool:
             self.ui.start_operation(f"Exporting {email} to Excel...")
             output_file = self.file_manager.get_export_path(email, start_date, end_date)
             if self.export_manager.export_to_excel(emails_data, output_file, email):
-                self.ui.display_success(f"Successfully exported {len(emails_data)} emails from {email} to {output_file}")
+                # Very large exports are split into several part files
+                files = self.export_manager.output_files(output_file, len(emails_data))
+                self.ui.display_success(f"Successfully exported {len(emails_data)} emails from {email} to {', '.join(files)}")
                 return True
             else:
                 self.ui.display_error(f"Failed to export emails for {email}")
@@ -104,110 +108,211 @@ class GmailExportTool:
         finally:
             self.ui.stop_operation()
 
+    def export_all_accounts(
+        self, accounts: List[str], start_date: datetime, end_date: datetime
+    ) -> Tuple[int, int]:
+        """
+        Export emails from several accounts.
+
+        OAuth accounts are fetched in parallel and their workbooks written
+        in parallel worker processes. IMAP accounts are exported one at a
+        time through export_single_account.
+
+        Args:
+            accounts: Email addresses to export.
+            start_date: Start date for email fetch.
+            end_date: End date for email fetch.
+
+        Returns:
+            Tuple[int, int]: Number of successful and failed exports.
+        """
+        successful_exports = 0
+        failed_exports = 0
+
+        oauth_accounts = []
+        for email in accounts:
+            account = self.account_manager.get_account_details(email)
+            if account and account.get("auth_method", "oauth") == "oauth":
+                oauth_accounts.append(email)
+            elif self.export_single_account(email, start_date, end_date):
+                successful_exports += 1
+            else:
+                failed_exports += 1
+
+        if not oauth_accounts:
+            return successful_exports, failed_exports
+
+        # No spinner here: services are set up first and an OAuth sign-in
+        # prompt must not be drawn over. Each account gets its own bar once
+        # it has been listed
+        self.ui.display_success(f"Starting email fetch for {len(oauth_accounts)} account(s)...")
+        bars = {}
+        bars_lock = threading.Lock()
+
+        def on_progress(email, done, total):
+            with bars_lock:
+                pbar = bars.get(email)
+                if pbar is None:
+                    pbar = bars[email] = self.ui.display_progress(
+                        total=total,
+                        desc=f"Fetching emails from {email}",
+                        position=len(bars),
+                    )
+                pbar.update(done - pbar.n)
+
+        try:
+            results = self.gmail_service.fetch_all_accounts(
+                oauth_accounts, start_date, end_date, on_progress=on_progress
+            )
+        finally:
+            for pbar in bars.values():
+                pbar.close()
+
+        jobs = []
+        for email in oauth_accounts:
+            if email not in results:
+                self.ui.display_error(f"Failed to fetch emails for {email}")
+                failed_exports += 1
+            elif not results[email]:
+                self.ui.display_error(f"No emails found for {email} in the specified date range")
+                failed_exports += 1
+            else:
+                output_file = self.file_manager.get_export_path(email, start_date, end_date)
+                jobs.append((results[email], output_file, email))
+
+        try:
+            self.ui.start_operation(f"Exporting {len(jobs)} account(s) to Excel...")
+            exported = self.export_manager.export_many(jobs)
+        finally:
+            self.ui.stop_operation()
+
+        for (emails_data, output_file, email), success in zip(jobs, exported):
+            if success:
+                files = self.export_manager.output_files(output_file, len(emails_data))
+                self.ui.display_success(f"Successfully exported {len(emails_data)} emails from {email} to {', '.join(files)}")
+                successful_exports += 1
+            else:
+                self.ui.display_error(f"Failed to export emails for {email}")
+                failed_exports += 1
+
+        return successful_exports, failed_exports
+
+    def _handle_add_account(self):
+        """Add a Gmail account and run the OAuth consent if needed."""
+        email = self.ui.get_email()
+        if not email:
+            return
+
+        try:
+            # Get authentication method
+            self.ui.display_auth_help()
+            auth_method = self.ui.get_auth_method()
+
+            app_password = None
+            if auth_method == "imap":
+                app_password = self.ui.get_app_password()
+
+            # Add account with selected auth method
+            if self.account_manager.add_account(email, auth_method, app_password):
+                if auth_method == "oauth":
+                    # Test OAuth setup
+                    self.ui.start_operation(f"Setting up {email}")
+                    self.gmail_service.setup_service(email)
+                    self.ui.stop_operation()
+                self.ui.display_success(f"Successfully added {email} with {auth_method.upper()} authentication")
+            else:
+                self.ui.display_error(f"Failed to add {email}")
+
+        except Exception as e:
+            self.ui.display_error(str(e))
+        finally:
+            self.ui.stop_operation()
+
+    def _handle_remove_account(self):
+        """Remove a Gmail account after confirmation."""
+        accounts = self.account_manager.list_accounts()
+        email = self.ui.select_account(accounts)
+        if email and self.ui.confirm_action(f"Remove {email}?"):
+            if self.account_manager.remove_account(email):
+                self.ui.display_success(f"Successfully removed {email}")
+            else:
+                self.ui.display_error(f"Failed to remove {email}")
+
+    def _handle_export_single(self):
+        """Export sent emails from one selected account."""
+        accounts = self.account_manager.list_accounts()
+        if not accounts:
+            self.ui.display_error("No accounts available. Please add an account first.")
+            return
+
+        email = self.ui.select_account(accounts)
+        if not email:
+            return
+
+        try:
+            start_date, end_date = self.ui.get_date_range()
+            self.export_single_account(email, start_date, end_date)
+        except Exception as e:
+            self.ui.display_error(str(e))
+
+    def _handle_export_all(self):
+        """Export sent emails from every registered account."""
+        accounts = self.account_manager.list_accounts()
+        if not accounts:
+            self.ui.display_error("No accounts available. Please add an account first.")
+            return
+
+        if not self.ui.confirm_action("Export emails from all accounts?"):
+            return
+
+        try:
+            start_date, end_date = self.ui.get_date_range()
+            successful_exports, failed_exports = self.export_all_accounts(
+                accounts, start_date, end_date
+            )
+
+            # Display summary
+            if successful_exports > 0:
+                self.ui.display_success(f"Successfully exported emails from {successful_exports} account(s)")
+            if failed_exports > 0:
+                self.ui.display_error(f"Failed to export emails from {failed_exports} account(s)")
+
+        except Exception as e:
+            self.ui.display_error(str(e))
+
+    def _handle_configure_dates(self):
+        """Configure the default date range."""
+        try:
+            self.ui.configure_date_range()
+        except Exception as e:
+            self.ui.display_error(f"Error configuring dates: {str(e)}")
+
+    def _handle_exit(self) -> bool:
+        """
+        Ask for confirmation before exiting.
+
+        Returns:
+            bool: True if the main loop should stop.
+        """
+        if self.ui.confirm_action("Are you sure you want to exit?"):
+            self.ui.display_success("Goodbye!")
+            return True
+        return False
+
     def run(self):
         """Run the main application loop."""
+        self.ui.display_banner()
         while True:
-            self.ui.display_banner()
             self.ui.display_menu()
-            choice = self.ui.get_menu_choice()
-
-            if choice == 1:  # Add Gmail Account
-                email = self.ui.get_email()
-                if email:
-                    try:
-                        # Get authentication method
-                        self.ui.display_auth_help()
-                        auth_method = self.ui.get_auth_method()
-                        
-                        app_password = None
-                        if auth_method == "imap":
-                            app_password = self.ui.get_app_password()
-                        
-                        # Add account with selected auth method
-                        if self.account_manager.add_account(email, auth_method, app_password):
-                            if auth_method == "oauth":
-                                # Test OAuth setup
-                                self.ui.start_operation(f"Setting up {email}")
-                                self.gmail_service.setup_service(email)
-                                self.ui.stop_operation()
-                            self.ui.display_success(f"Successfully added {email} with {auth_method.upper()} authentication")
-                        else:
-                            self.ui.display_error(f"Failed to add {email}")
-                            
-                    except Exception as e:
-                        self.ui.display_error(str(e))
-                    finally:
-                        self.ui.stop_operation()
-
-            elif choice == 2:  # Remove Gmail Account
-                accounts = self.account_manager.list_accounts()
-                email = self.ui.select_account(accounts)
-                if email:
-                    if self.ui.confirm_action(f"Remove {email}?"):
-                        if self.account_manager.remove_account(email):
-                            self.ui.display_success(f"Successfully removed {email}")
-                        else:
-                            self.ui.display_error(f"Failed to remove {email}")
-
-            elif choice == 3:  # Export Emails (Single Account)
-                accounts = self.account_manager.list_accounts()
-                if not accounts:
-                    self.ui.display_error("No accounts available. Please add an account first.")
-                    continue
-
-                email = self.ui.select_account(accounts)
-                if not email:
-                    continue
-
-                try:
-                    start_date, end_date = self.ui.get_date_range()
-                    self.export_single_account(email, start_date, end_date)
-                except Exception as e:
-                    self.ui.display_error(str(e))
-
-            elif choice == 4:  # Export Emails (All Accounts)
-                accounts = self.account_manager.list_accounts()
-                if not accounts:
-                    self.ui.display_error("No accounts available. Please add an account first.")
-                    continue
-
-                if not self.ui.confirm_action("Export emails from all accounts?"):
-                    continue
-
-                try:
-                    start_date, end_date = self.ui.get_date_range()
-                    successful_exports = 0
-                    failed_exports = 0
-
-                    for email in accounts:
-                        if self.export_single_account(email, start_date, end_date):
-                            successful_exports += 1
-                        else:
-                            failed_exports += 1
-
-                    # Display summary
-                    if successful_exports > 0:
-                        self.ui.display_success(f"Successfully exported emails from {successful_exports} account(s)")
-                    if failed_exports > 0:
-                        self.ui.display_error(f"Failed to export emails from {failed_exports} account(s)")
-
-                except Exception as e:
-                    self.ui.display_error(str(e))
-
-            elif choice == 5:  # Configure Date Range
-                try:
-                    self.ui.configure_date_range()
-                except Exception as e:
-                    self.ui.display_error(f"Error configuring dates: {str(e)}")
-
-            elif choice == 6:  # Exit
-                if self.ui.confirm_action("Are you sure you want to exit?"):
-                    self.ui.display_success("Goodbye!")
-                    break
+            handler = self._dispatch.get(self.ui.get_menu_choice())
+            # Handlers return True to end the session
+            if handler is not None and handler():
+                break
 
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=config.LOG_LEVEL, format=config.LOG_FORMAT)
     tool = GmailExportTool()
     tool.run()
 
@@ -0,0 +1,76 @@
+"""
+Optional cProfile instrumentation for the Gmail Export Tool.
+
+Enabled with ``python run.py --profile``. Every profiled section is dumped
+to its own .prof file in config.PROFILES_DIR, which can be opened with
+snakeviz or pstats. Typical top entries are socket reads (the export is
+waiting on Gmail; fetching is network-bound) or openpyxl / zipfile frames
+(the Excel write is the bottleneck).
+"""
+import cProfile
+import itertools
+import logging
+import os
+import pstats
+import threading
+from contextlib import contextmanager
+
+from src import config
+
+logger = logging.getLogger(__name__)
+
+_enabled = False
+_profile_ids = itertools.count(1)
+
+
+def enable():
+    """Turn profiling on for the rest of the process."""
+    global _enabled
+    _enabled = True
+    os.makedirs(config.PROFILES_DIR, exist_ok=True)
+
+
+@contextmanager
+def profiled(name: str, report: bool = False):
+    """
+    Profile the enclosed block when profiling is enabled.
+
+    Before Python 3.12 cProfile only sees the thread it runs in, so worker
+    threads wrap their own work in a section of their own. From 3.12 on a
+    process can run only one profiler, which already sees every thread;
+    nested sections then run unprofiled.
+
+    Args:
+        name: Prefix for the .prof file.
+        report: Also print the top entries by cumulative time.
+    """
+    if not _enabled:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # "Another profiling tool is already active" (Python 3.12+)
+        profiler = None
+
+    if profiler is None:
+        yield
+        return
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profile_file = os.path.join(
+            config.PROFILES_DIR,
+            f"{name}-{threading.get_ident()}-{next(_profile_ids)}.prof",
+        )
+        try:
+            profiler.dump_stats(profile_file)
+            logger.info(f"Profile written to {profile_file}")
+            if report:
+                pstats.Stats(profile_file).sort_stats("cumulative").print_stats(40)
+        except Exception as e:
+            logger.error(f"Error writing profile {profile_file}: {str(e)}")
@@ -6,10 +6,6 @@ from datetime import datetime
 from typing import Tuple, Optional
 from src import config
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 
 class UserInterface:
     """Handles all user interface operations."""